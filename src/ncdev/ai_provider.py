@@ -184,11 +184,25 @@ class _CLIProviderMixin:
                 stdout, stderr = proc.communicate(timeout=timeout)
             except subprocess.TimeoutExpired:
                 if not IS_WINDOWS:
-                    os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+                    try:
+                        os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+                    except (ProcessLookupError, PermissionError):
+                        proc.kill()
                 else:
                     proc.kill()
-                proc.wait(timeout=5)
-                logger.error("%s CLI timed out after %ds", self._cmd_name, timeout)
+                # A second communicate() after TimeoutExpired is the
+                # documented way to reap: it closes the pipes and hands
+                # back whatever the child wrote before the kill, which
+                # is the only diagnostic we get for a hung CLI.
+                try:
+                    _, partial_err = proc.communicate(timeout=5)
+                except subprocess.TimeoutExpired:
+                    partial_err = b""
+                logger.error(
+                    "%s CLI timed out after %ds. stderr tail: %s",
+                    self._cmd_name, timeout,
+                    partial_err.decode(errors="replace").strip()[-500:] if partial_err else "",
+                )
                 return None
 
             response = stdout.decode().strip() if stdout else ""
@@ -242,13 +256,14 @@ class _CLIProviderMixin:
 
         loop = asyncio.get_running_loop()
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(
+            # _call_sync enforces `timeout` itself and reaps its child; this
+            # outer deadline is only a backstop. asyncio.timeout() cancels in
+            # place instead of wrapping the executor future in another task.
+            async with asyncio.timeout(timeout + 10):
+                return await loop.run_in_executor(
                     _executor, self._call_sync, prompt, timeout, cwd, tools,
-                ),
-                timeout=timeout + 10,
-            )
-        except asyncio.TimeoutError:
+                )
+        except TimeoutError:
             logger.error("%s CLI timed out after %ds", self._cmd_name, timeout)
             return None
         except Exception as exc:
@@ -18,6 +18,12 @@ and dispatches to the right concrete runner:
 The returned :class:`ClaudeSessionResult` is the common result shape
 across runners — ``skills_invoked`` and ``codex_invocations`` are
 populated only when they applied.
+
+Every session is a fresh CLI process. A long-lived ``claude``/``codex``
+process multiplexing prompts would carry conversation state, hooks and
+cwd from one feature into the next, and neither CLI offers a
+stateless request/response daemon. Startup cost is trimmed instead by
+memoising the per-binary capability probe and the prompt files.
 """
 
 from __future__ import annotations
@@ -34,11 +40,13 @@ from pathlib import Path
 from typing import Callable, Iterable
 
 from ncdev.claude_session import (
+    CLI_MISSING_ERROR,
     DEFAULT_BUILD_TOOLS,
     ClaudeSessionResult,
     run_claude_session,
 )
 from ncdev.core.config import NCDevConfig, load_config
+from ncdev.utils import TailBuffer
 
 _IS_POSIX = sys.platform != "win32"
 
@@ -226,7 +234,7 @@ def run_codex_session(
     if shutil.which("codex") is None:
         return ClaudeSessionResult(
             success=False, final_text="", exit_code=-1,
-            error="codex CLI not found on PATH",
+            error=f"codex {CLI_MISSING_ERROR}",
         )
 
     # Codex prompt must be scoped — no Claude skill references.
@@ -251,10 +259,15 @@ def run_codex_session(
         cmd += list(codex_options)
     if extra_args:
         cmd += list(extra_args)
-    cmd.append(codex_prompt)
+    # "-" makes codex read the prompt from stdin. Feature prompts embed
+    # whole charters and run to hundreds of KB — as a single argv entry
+    # they brush against ARG_MAX (and the per-arg MAX_ARG_STRLEN of
+    # 128 KB on Linux), so they are piped instead.
+    cmd.append("-")
 
     popen_kwargs: dict = dict(
         cwd=str(cwd),
+        stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -263,7 +276,7 @@ def run_codex_session(
     if _IS_POSIX:
         popen_kwargs["start_new_session"] = True
 
-    start = time.time()
+    start = time.perf_counter()
     try:
         proc = subprocess.Popen(cmd, **popen_kwargs)
     except (FileNotFoundError, OSError) as exc:
@@ -272,10 +285,10 @@ def run_codex_session(
             error=f"failed to spawn codex: {exc}",
         )
 
-    stdout_buf = _TailBuffer(max_bytes_per_stream)
-    stderr_buf = _TailBuffer(max_bytes_per_stream)
+    stdout_buf = TailBuffer(max_bytes_per_stream)
+    stderr_buf = TailBuffer(max_bytes_per_stream)
 
-    def _drain(stream, buf: "_TailBuffer") -> None:
+    def _drain(stream, buf: TailBuffer) -> None:
         try:
             for line in stream:
                 buf.append(line)
@@ -302,8 +315,21 @@ def run_codex_session(
             timeout_fired.set()
             _kill_process_tree(proc)
 
+    # Armed before the prompt is written: a child that never reads stdin
+    # blocks a prompt larger than the pipe buffer, and the timeout must
+    # still fire (the kill then breaks the pipe and ends the write).
     threading.Thread(target=_watchdog, daemon=True).start()
 
+    # Readers are already draining, so a large prompt can't deadlock
+    # against a child that writes before it finishes reading stdin.
+    try:
+        proc.stdin.write(codex_prompt)
+        proc.stdin.close()
+    except (BrokenPipeError, OSError):
+        # Child exited before consuming the prompt — its exit code and
+        # stderr tell the story below.
+        pass
+
     try:
         proc.wait(timeout=timeout + 30)
     except subprocess.TimeoutExpired:
@@ -317,7 +343,7 @@ def run_codex_session(
     stdout_thread.join(timeout=2.0)
     stderr_thread.join(timeout=2.0)
 
-    duration = time.time() - start
+    duration = time.perf_counter() - start
     final_text = stdout_buf.text()
     stderr_text = stderr_buf.text()
     exit_code = proc.returncode if proc.returncode is not None else -1
@@ -362,56 +388,6 @@ def run_codex_session(
 # ---------------------------------------------------------------------------
 
 
-class _TailBuffer:
-    """Accumulate text but keep only the tail of ``max_bytes``.
-
-    Recent output is more useful than the head when debugging a builder
-    that went off the rails. ``truncated`` flips True once we start
-    dropping bytes so callers can surface that to users / logs.
-
-    If a single incoming chunk is larger than ``max_bytes``, we slice
-    the tail bytes out of *that* chunk instead of evicting it wholesale
-    (Codex R3 flagged: the previous behavior produced an empty buffer
-    when a single append overflowed the cap).
-    """
-
-    __slots__ = ("_chunks", "_size", "_max", "truncated")
-
-    def __init__(self, max_bytes: int) -> None:
-        self._chunks: list[str] = []
-        self._size = 0
-        self._max = max(max_bytes, 1)
-        self.truncated = False
-
-    def append(self, chunk: str) -> None:
-        if not chunk:
-            return
-
-        # Oversized single chunk: keep the tail bytes of this chunk only.
-        chunk_bytes = chunk.encode("utf-8", errors="ignore")
-        if len(chunk_bytes) > self._max:
-            tail_bytes = chunk_bytes[-self._max:]
-            tail = tail_bytes.decode("utf-8", errors="ignore")
-            self._chunks = [tail]
-            self._size = len(tail.encode("utf-8", errors="ignore"))
-            self.truncated = True
-            return
-
-        self._chunks.append(chunk)
-        self._size += len(chunk_bytes)
-
-        # Normal eviction path: drop whole chunks from the head until
-        # we're under the cap again. Safe now because no single chunk
-        # is larger than ``_max``.
-        while self._size > self._max and len(self._chunks) > 1:
-            head = self._chunks.pop(0)
-            self._size -= len(head.encode("utf-8", errors="ignore"))
-            self.truncated = True
-
-    def text(self) -> str:
-        return "".join(self._chunks)
-
-
 def _kill_process_tree(proc: subprocess.Popen) -> None:
     """Kill a process and its children. Mirror of claude_session's helper."""
     if proc.poll() is not None:
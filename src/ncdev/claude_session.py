@@ -21,16 +21,53 @@ import subprocess
 import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Iterable
+from typing import Any, Callable, Iterable
+
+from ncdev.utils import TailBuffer, read_text_cached
+
+# Every stream-json line is parsed on the reader thread; orjson does it
+# straight from the C side when installed.
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # pragma: no cover - optional accelerator
+    _orjson_loads = None
+
+
+def _json_loads(line: str) -> Any:
+    """``json.loads`` semantics, through orjson when it is installed.
+
+    orjson is stricter than the stdlib: it rejects lone surrogate escapes
+    and NaN/Infinity tokens. Its decode error subclasses
+    json.JSONDecodeError, so such a line is retried with the stdlib
+    rather than dropped -- it may be the ``result`` event.
+    """
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(line)
+        except json.JSONDecodeError:
+            pass
+    return json.loads(line)
+
 
 IS_POSIX = sys.platform != "win32"
 
+# Suffix of the session error when the agent CLI binary is absent. The
+# pipeline engine halts the run on it, so both runners build their error
+# from this constant rather than spelling it out.
+CLI_MISSING_ERROR = "CLI not found on PATH"
+
 
 PROTOCOLS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts" / "protocols"
 CODEX_PROTOCOL_PATH = PROTOCOLS_DIR / "codex-via-bash.md"
 
+# Upper bound on captured Claude stderr. Stdout is parsed event by event
+# and never accumulated; stderr is only surfaced for diagnostics, where
+# the tail is what matters.
+_STDERR_CAPTURE_MAX_BYTES = 1024 * 1024   # 1 MB
+
 # Default NC Dev hooks — block commits with prohibited patterns / non-
 # conventional messages, block force-push to protected branches.
 NCDEV_HOOKS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts" / "ncdev-hooks"
@@ -42,15 +79,17 @@ NCDEV_HOOKS_SETTINGS = NCDEV_HOOKS_DIR / "settings.json"
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+# slots=True: a long session records thousands of ToolCallRecords and
+# results are held across retry chains — no per-instance __dict__.
+@dataclass(slots=True)
 class ToolCallRecord:
     """One tool invocation observed in the stream."""
     tool: str
     input_summary: str  # truncated string form of the input
-    raw: dict
+    raw: dict           # full tool_use item; {} unless retain_events
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeSessionResult:
     """Structured outcome of a Claude session."""
     success: bool
@@ -186,8 +225,10 @@ def run_claude_session(
         When True, every stream event is appended to
         :attr:`ClaudeSessionResult.events`. Default ``False`` because
         long sessions can produce tens of thousands of events and we
-        log them to JSONL already (``log_path``). Turn on for tests /
-        debugging only.
+        log them to JSONL already (``log_path``). Also gates
+        :attr:`ToolCallRecord.raw`: a ``Write`` tool_use item carries
+        the whole file body, so raw items are only kept alongside the
+        events. Turn on for tests / debugging only.
     """
     _requested_was_auto = model.strip().lower() in ("auto", "latest", "")
 
@@ -219,13 +260,13 @@ def run_claude_session(
     if shutil.which("claude") is None:
         return ClaudeSessionResult(
             success=False, final_text="", exit_code=-1,
-            error="claude CLI not found on PATH",
+            error=f"claude {CLI_MISSING_ERROR}",
         )
 
     # Compose the system prompt append block
     system_prompt_parts: list[str] = []
     if include_codex_protocol and CODEX_PROTOCOL_PATH.exists():
-        system_prompt_parts.append(CODEX_PROTOCOL_PATH.read_text(encoding="utf-8"))
+        system_prompt_parts.append(read_text_cached(CODEX_PROTOCOL_PATH))
     if append_system_prompt:
         system_prompt_parts.append(append_system_prompt)
     system_prompt = "\n\n---\n\n".join(system_prompt_parts) if system_prompt_parts else None
@@ -276,25 +317,35 @@ def run_claude_session(
     if extra_args:
         cmd += list(extra_args)
 
-    start = time.time()
-    events: list[dict] = []
+    # Durations come from perf_counter: monotonic, so an NTP step or
+    # manual clock change mid-session can't skew or negate the result.
+    start = time.perf_counter()
+    # Without retain_events only a short ring is kept, for the
+    # final_text fallback path.
+    events: list[dict] | deque[dict] = [] if retain_events else deque(maxlen=20)
     log_fh = None
     if log_path is not None:
         log_path.parent.mkdir(parents=True, exist_ok=True)
         log_fh = log_path.open("w", encoding="utf-8")
 
-    subproc_env = os.environ.copy()
-    subproc_env.update(env_overrides)
     popen_kwargs: dict = dict(
         cwd=str(cwd),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
         bufsize=1,
-        env=subproc_env,
+        # env=None inherits the parent environment without building a
+        # dict; only pay for the merge when hooks inject variables.
+        env={**os.environ, **env_overrides} if env_overrides else None,
     )
     if IS_POSIX:
         # Own process group so we can SIGKILL the whole tree on timeout.
+        # setsid() runs in the child inside _posixsubprocess, so CPython
+        # still launches via vfork() on Linux. Keep it that way: a
+        # preexec_fn (or user/group switching) forces a full fork(),
+        # whose cost grows with this process's RSS. Likewise leave
+        # close_fds at its default: the child closes inherited fds with
+        # one close_range() call, not a loop up to RLIMIT_NOFILE.
         popen_kwargs["start_new_session"] = True
 
     try:
@@ -313,8 +364,12 @@ def run_claude_session(
     codex_calls: list[str] = []
     subagents: list[str] = []
     files_touched: set[str] = set()
+    signals = _SignalSink(
+        skills, tool_calls, codex_calls, subagents, files_touched,
+        keep_raw=retain_events,
+    )
     total_cost: float | None = None
-    stderr_chunks: list[str] = []
+    stderr_buf = TailBuffer(_STDERR_CAPTURE_MAX_BYTES)
 
     # Thread-based pipe readers prevent the two classes of hang Codex
     # called out:
@@ -328,7 +383,7 @@ def run_claude_session(
     def _drain_stderr() -> None:
         try:
             for line in proc.stderr:  # type: ignore[union-attr]
-                stderr_chunks.append(line)
+                stderr_buf.append(line)
         except Exception:  # noqa: BLE001
             pass
         finally:
@@ -358,31 +413,20 @@ def run_claude_session(
             if not line:
                 continue
             try:
-                event = json.loads(line)
+                event = _json_loads(line)
             except json.JSONDecodeError:
                 if log_fh:
                     log_fh.write(json.dumps({"_raw": line}) + "\n")
                 continue
 
-            if retain_events:
-                events.append(event)
-            else:
-                # Keep a small ring buffer for the final_text fallback path.
-                events.append(event)
-                if len(events) > 20:
-                    events.pop(0)
+            events.append(event)
             if log_fh:
-                log_fh.write(json.dumps(event) + "\n")
+                # The stripped line is already one compact JSON document;
+                # re-serialising the parsed event would only reproduce it.
+                log_fh.write(line + "\n")
                 log_fh.flush()
 
-            _extract_event_signals(
-                event,
-                skills=skills,
-                tool_calls=tool_calls,
-                codex_calls=codex_calls,
-                subagents=subagents,
-                files_touched=files_touched,
-            )
+            _extract_event_signals(event, signals)
 
             if event.get("type") == "result":
                 final_text = event.get("result") or event.get("text") or final_text
@@ -410,9 +454,9 @@ def run_claude_session(
         if log_fh:
             log_fh.close()
 
-    stderr_text = "".join(stderr_chunks)
+    stderr_text = stderr_buf.text()
     exit_code = proc.returncode if proc.returncode is not None else -1
-    duration = time.time() - start
+    duration = time.perf_counter() - start
 
     result_events = list(events) if retain_events else []
 
@@ -494,72 +538,110 @@ def _kill_process_tree(proc: subprocess.Popen) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _extract_event_signals(
-    event: dict,
-    *,
-    skills: list[str],
-    tool_calls: list[ToolCallRecord],
-    codex_calls: list[str],
-    subagents: list[str],
-    files_touched: set[str],
-) -> None:
+class _SignalSink:
+    """The accumulators one session's stream parse appends into.
+
+    Bundled so the per-tool handlers below share a single signature
+    instead of each taking five keyword arguments.
+    """
+
+    __slots__ = (
+        "skills", "tool_calls", "codex_calls", "subagents", "files_touched", "keep_raw",
+    )
+
+    def __init__(
+        self,
+        skills: list[str],
+        tool_calls: list[ToolCallRecord],
+        codex_calls: list[str],
+        subagents: list[str],
+        files_touched: set[str],
+        *,
+        keep_raw: bool = False,
+    ) -> None:
+        self.skills = skills
+        self.tool_calls = tool_calls
+        self.codex_calls = codex_calls
+        self.subagents = subagents
+        self.files_touched = files_touched
+        self.keep_raw = keep_raw
+
+
+# Each handler records the tool's signal (if any) and returns the
+# truncated input summary, so one dict lookup per tool_use item replaces
+# the separate if/elif chains for signal extraction and summarizing.
+
+
+def _on_bash(data: dict, sink: _SignalSink) -> str:
+    cmd = str(data.get("command", ""))
+    if "codex exec" in cmd or cmd.strip().startswith("codex "):
+        sink.codex_calls.append(cmd[:500])
+    return cmd[:200]
+
+
+def _on_file_edit(data: dict, sink: _SignalSink) -> str:
+    path = data.get("file_path")
+    if path:
+        sink.files_touched.add(path)
+    return str(data.get("file_path", ""))[:200]
+
+
+def _on_read(data: dict, sink: _SignalSink) -> str:  # noqa: ARG001
+    return str(data.get("file_path", ""))[:200]
+
+
+def _on_skill(data: dict, sink: _SignalSink) -> str:
+    skill_name = data.get("skill") or data.get("name")
+    if skill_name and skill_name not in sink.skills:
+        sink.skills.append(skill_name)
+    return str(skill_name or "")[:200]
+
+
+def _on_task(data: dict, sink: _SignalSink) -> str:
+    agent = data.get("subagent_type") or data.get("agent")
+    if agent:
+        sink.subagents.append(agent)
+    desc = data.get("description", "")
+    sub = data.get("subagent_type", "")
+    return f"{sub}: {desc}"[:200]
+
+
+_TOOL_HANDLERS: dict[str, Callable[[dict, _SignalSink], str]] = {
+    "Bash": _on_bash,
+    "Write": _on_file_edit,
+    "Edit": _on_file_edit,
+    "Read": _on_read,
+    "Skill": _on_skill,
+    "Task": _on_task,
+}
+
+
+def _extract_event_signals(event: dict, sink: _SignalSink) -> None:
     """Pull structured signals out of a stream event.
 
     Stream-json schema has evolved across Claude Code versions — we keep
     this tolerant: inspect common shapes, ignore unknowns.
     """
-    ev_type = event.get("type")
-
     # Tool use appears inside assistant messages as content items with
-    # type=tool_use. Extract recursively.
-    if ev_type == "assistant":
-        message = event.get("message") or {}
-        content = message.get("content") or []
-        for item in content:
-            if not isinstance(item, dict):
-                continue
-            if item.get("type") == "tool_use":
-                tool_name = item.get("name", "?")
-                input_data = item.get("input") or {}
-                summary = _summarize_input(tool_name, input_data)
-                tool_calls.append(ToolCallRecord(
-                    tool=tool_name,
-                    input_summary=summary,
-                    raw=item,
-                ))
-                if tool_name == "Skill":
-                    skill_name = input_data.get("skill") or input_data.get("name")
-                    if skill_name and skill_name not in skills:
-                        skills.append(skill_name)
-                elif tool_name == "Task":
-                    agent = input_data.get("subagent_type") or input_data.get("agent")
-                    if agent:
-                        subagents.append(agent)
-                elif tool_name == "Bash":
-                    cmd = input_data.get("command", "")
-                    if "codex exec" in cmd or cmd.strip().startswith("codex "):
-                        codex_calls.append(cmd[:500])
-                elif tool_name in ("Write", "Edit"):
-                    path = input_data.get("file_path")
-                    if path:
-                        files_touched.add(path)
-
-
-def _summarize_input(tool: str, data: dict) -> str:
-    if tool == "Bash":
-        cmd = str(data.get("command", ""))
-        return cmd[:200]
-    if tool in ("Write", "Edit"):
-        return str(data.get("file_path", ""))[:200]
-    if tool == "Read":
-        return str(data.get("file_path", ""))[:200]
-    if tool == "Skill":
-        return str(data.get("skill") or data.get("name") or "")[:200]
-    if tool == "Task":
-        desc = data.get("description", "")
-        sub = data.get("subagent_type", "")
-        return f"{sub}: {desc}"[:200]
-    return str(data)[:200]
+    # type=tool_use.
+    if event.get("type") != "assistant":
+        return
+    message = event.get("message") or {}
+    for item in message.get("content") or []:
+        if not isinstance(item, dict) or item.get("type") != "tool_use":
+            continue
+        tool_name = item.get("name", "?")
+        input_data = item.get("input") or {}
+        handler = _TOOL_HANDLERS.get(tool_name)
+        if handler is not None:
+            summary = handler(input_data, sink)
+        else:
+            summary = str(input_data)[:200]
+        sink.tool_calls.append(ToolCallRecord(
+            tool=tool_name,
+            input_summary=summary,
+            raw=item if sink.keep_raw else {},
+        ))
 
 
 def _extract_text(event: dict) -> str:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import shutil
 import subprocess
@@ -90,6 +91,36 @@ def _check_app_boots(target_path: Path) -> bool:
         return False
 
 
+def _checkpoint_working_tree(target: Path) -> str:
+    """Snapshot the working tree with ``git stash create``; '' if clean."""
+    snapshot = subprocess.run(
+        ["git", "stash", "create"],
+        cwd=str(target),
+        capture_output=True,
+        text=True,
+    )
+    return snapshot.stdout.strip()
+
+
+def _revert_to_checkpoint(target: Path, stash_sha: str) -> None:
+    """Discard a failed fix attempt and restore the pre-fix snapshot."""
+    subprocess.run(["git", "checkout", "."], cwd=str(target), capture_output=True)
+    subprocess.run(["git", "clean", "-fd"], cwd=str(target), capture_output=True)
+    if stash_sha:
+        subprocess.run(["git", "stash", "apply", stash_sha], cwd=str(target), capture_output=True)
+
+
+def _commit_fix(target: Path, message: str) -> bool:
+    """Stage and commit everything; True if the commit landed."""
+    subprocess.run(["git", "add", "-A"], cwd=str(target), capture_output=True)
+    commit_result = subprocess.run(
+        ["git", "commit", "-m", message],
+        cwd=str(target),
+        capture_output=True,
+    )
+    return commit_result.returncode == 0
+
+
 async def _run_quality_gate_fixes(manifest, config=None) -> int:
     """Apply quality gate fixes using the AI provider adapter.
 
@@ -146,55 +177,70 @@ async def _run_quality_gate_fixes(manifest, config=None) -> int:
 
     fix_tools = ["Edit", "Write", "Bash", "Read", "Glob", "Grep"]
 
-    for url, group_issues in url_groups.items():
-        if not group_issues:
-            continue
-
-        # Use the highest priority timeout for the group
-        timeout = min(
-            timeout_by_priority.get(i.priority, 120) for i in group_issues
+    def _start_citex_lookups(url: str) -> asyncio.Future | None:
+        # Blocking HTTP (up to 30s each), so both lookups run off the
+        # event loop. gather() schedules them now; the caller awaits later.
+        if not citex:
+            return None
+        return asyncio.gather(
+            asyncio.to_thread(
+                citex.query, f"Test findings for {url}", category="signals", limit=2,
+            ),
+            asyncio.to_thread(
+                citex.query, f"Component handling {url}", category="code", limit=2,
+            ),
         )
-        # Give grouped fixes more time (multiple issues)
-        if len(group_issues) > 1:
-            timeout = min(timeout * 2, config.ai_fix_timeout)
 
-        console.print(
-            f"\n[cyan]Fixing {len(group_issues)} issue(s) at {url} "
-            f"(timeout {timeout}s)[/cyan]"
-        )
-        for gi in group_issues:
-            console.print(f"  [{gi.priority}] {gi.title}")
+    groups = [(url, issues) for url, issues in url_groups.items() if issues]
+    # The lookups depend only on the URL: start the next group's while
+    # this group is checkpointed and fixed -- one group ahead, no further.
+    next_lookups = _start_citex_lookups(groups[0][0]) if groups else None
+    lookups = None
+    try:
+        for n, (url, group_issues) in enumerate(groups):
+            lookups = next_lookups
+            next_lookups = (
+                _start_citex_lookups(groups[n + 1][0]) if n + 1 < len(groups) else None
+            )
 
-        # Checkpoint before fix attempt -- snapshot working tree
-        snapshot = subprocess.run(
-            ["git", "stash", "create"],
-            cwd=str(target),
-            capture_output=True,
-            text=True,
-        )
-        stash_sha = snapshot.stdout.strip()
-
-        # Build a combined prompt for all issues at this URL
-        issues_description = "\n\n".join([
-            f"Issue {idx+1}: [{i.priority}] {i.title}\n"
-            f"  Category: {i.category}\n"
-            f"  Flow: {i.flow}\n"
-            f"  Expected: {i.expected}\n"
-            f"  Actual: {i.actual}\n"
-            f"  Hint: {i.root_cause_hint or 'None provided'}\n"
-            f"  Affected files: {', '.join(p for p in i.affected_files_hint if p) or 'unknown'}"
-            for idx, i in enumerate(group_issues)
-        ])
-
-        # Enrich with Citex context (if available)
-        citex_context = ""
-        if citex:
-            tc_findings = citex.query(f"Test findings for {url}", category="signals", limit=2)
-            code_context = citex.query(f"Component handling {url}", category="code", limit=2)
-            if tc_findings or code_context:
-                findings_text = chr(10).join(tc_findings) if tc_findings else "None available"
-                code_text = chr(10).join(code_context) if code_context else "None available"
-                citex_context = f"""
+            # Use the highest priority timeout for the group
+            timeout = min(
+                timeout_by_priority.get(i.priority, 120) for i in group_issues
+            )
+            # Give grouped fixes more time (multiple issues)
+            if len(group_issues) > 1:
+                timeout = min(timeout * 2, config.ai_fix_timeout)
+
+            console.print(
+                f"\n[cyan]Fixing {len(group_issues)} issue(s) at {url} "
+                f"(timeout {timeout}s)[/cyan]"
+            )
+            console.print("\n".join(f"  [{gi.priority}] {gi.title}" for gi in group_issues))
+
+            # Checkpoint before fix attempt -- snapshot working tree. Git
+            # calls run off the event loop, like the boot check below.
+            stash_sha = await asyncio.to_thread(_checkpoint_working_tree, target)
+
+            # Build a combined prompt for all issues at this URL
+            issues_description = "\n\n".join([
+                f"Issue {idx+1}: [{i.priority}] {i.title}\n"
+                f"  Category: {i.category}\n"
+                f"  Flow: {i.flow}\n"
+                f"  Expected: {i.expected}\n"
+                f"  Actual: {i.actual}\n"
+                f"  Hint: {i.root_cause_hint or 'None provided'}\n"
+                f"  Affected files: {', '.join(p for p in i.affected_files_hint if p) or 'unknown'}"
+                for idx, i in enumerate(group_issues)
+            ])
+
+            # Enrich with Citex context (if available)
+            citex_context = ""
+            if lookups is not None:
+                tc_findings, code_context = await lookups
+                if tc_findings or code_context:
+                    findings_text = chr(10).join(tc_findings) if tc_findings else "None available"
+                    code_text = chr(10).join(code_context) if code_context else "None available"
+                    citex_context = f"""
 
 ## Additional Context from Citex RAG
 ### Test Craftr Findings
@@ -204,7 +250,7 @@ async def _run_quality_gate_fixes(manifest, config=None) -> int:
 {code_text}
 """
 
-        prompt = f"""Fix these {len(group_issues)} related issues at {url}:
+            prompt = f"""Fix these {len(group_issues)} related issues at {url}:
 
 {issues_description}
 
@@ -219,47 +265,44 @@ Requirements:
 - Print a short summary of what you changed and which tests you ran.
 {citex_context}"""
 
-        result = await provider.complete(
-            prompt=prompt,
-            timeout=timeout,
-            cwd=str(target),
-            tools=fix_tools,
-        )
+            result = await provider.complete(
+                prompt=prompt,
+                timeout=timeout,
+                cwd=str(target),
+                tools=fix_tools,
+            )
 
-        if result is None:
-            console.print("    [red]AI provider returned no result -- reverting[/red]")
-            subprocess.run(["git", "checkout", "."], cwd=str(target), capture_output=True)
-            subprocess.run(["git", "clean", "-fd"], cwd=str(target), capture_output=True)
-            if stash_sha:
-                subprocess.run(["git", "stash", "apply", stash_sha], cwd=str(target), capture_output=True)
-            continue
-
-        if not _check_app_boots(target):
-            console.print("    [red]Fix broke app -- reverting[/red]")
-            subprocess.run(["git", "checkout", "."], cwd=str(target), capture_output=True)
-            subprocess.run(["git", "clean", "-fd"], cwd=str(target), capture_output=True)
-            if stash_sha:
-                subprocess.run(["git", "stash", "apply", stash_sha], cwd=str(target), capture_output=True)
-            continue
-
-        # Success -- commit the fix for this URL group
-        issue_ids = ", ".join(i.id for i in group_issues)
-        commit_msg = (
-            f"fix: {len(group_issues)} issues at {url} [{issue_ids}]"
-            if len(group_issues) > 1
-            else f"fix: {group_issues[0].title} [{group_issues[0].id}]"
-        )
-        subprocess.run(["git", "add", "-A"], cwd=str(target), capture_output=True)
-        commit_result = subprocess.run(
-            ["git", "commit", "-m", commit_msg],
-            cwd=str(target),
-            capture_output=True,
-        )
-        if commit_result.returncode == 0:
-            fixed += len(group_issues)
-            console.print(f"    [green]Fixed and committed {len(group_issues)} issue(s)[/green]")
-        else:
-            console.print("    [yellow]Fix applied but commit failed[/yellow]")
+            if result is None:
+                console.print("    [red]AI provider returned no result -- reverting[/red]")
+                await asyncio.to_thread(_revert_to_checkpoint, target, stash_sha)
+                continue
+
+            # The boot check can block for up to 30s; keep the event loop
+            # (and anything awaiting on it, e.g. event publishing) responsive.
+            if not await asyncio.to_thread(_check_app_boots, target):
+                console.print("    [red]Fix broke app -- reverting[/red]")
+                await asyncio.to_thread(_revert_to_checkpoint, target, stash_sha)
+                continue
+
+            # Success -- commit the fix for this URL group
+            issue_ids = ", ".join(i.id for i in group_issues)
+            commit_msg = (
+                f"fix: {len(group_issues)} issues at {url} [{issue_ids}]"
+                if len(group_issues) > 1
+                else f"fix: {group_issues[0].title} [{group_issues[0].id}]"
+            )
+            if await asyncio.to_thread(_commit_fix, target, commit_msg):
+                fixed += len(group_issues)
+                console.print(f"    [green]Fixed and committed {len(group_issues)} issue(s)[/green]")
+            else:
+                console.print("    [yellow]Fix applied but commit failed[/yellow]")
+    finally:
+        # A fix step that raises leaves prefetched lookups unawaited;
+        # cancel them (or retrieve their outcome) so no task leaks.
+        for pending in (lookups, next_lookups):
+            if pending is None or pending.cancel() or pending.cancelled():
+                continue
+            pending.exception()
 
     tone = "green" if fixed == len(all_issues) else "yellow"
     console.print(
@@ -533,7 +576,6 @@ def main(argv: list[str] | None = None) -> int:
 
         if args.quality_gate and not args.dry_run:
             if args.legacy_quality_gate:
-                import asyncio
                 from ncdev.quality_gate.config import QualityGateConfig
                 from ncdev.quality_gate.orchestrator import QualityGateOrchestrator
 
@@ -729,8 +771,10 @@ def main(argv: list[str] | None = None) -> int:
         console.print(f"[bold]Skill candidates[/bold] (>= {args.threshold} recurrences):")
         if not candidates:
             console.print("  (none)")
-        for c in candidates:
-            console.print(f"  - {c.pattern}  [dim](x{c.occurrences})[/dim]")
+        else:
+            console.print("\n".join(
+                f"  - {c.pattern}  [dim](x{c.occurrences})[/dim]" for c in candidates
+            ))
         pending = list_pending_skills()
         console.print(f"[bold]Pending authored skills[/bold]: {', '.join(pending) or '(none)'}")
         return 0
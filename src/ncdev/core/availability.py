@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import os
 import shutil
+import time
 from collections.abc import Callable
 
 from ncdev.core.config import NCDevConfig
@@ -32,8 +33,28 @@ PROVIDER_PROBES: dict[str, tuple[str, str | list[str]]] = {
 }
 
 
+# (binary, PATH) -> (probed_at, found). Routing resolves every role
+# through the same few binaries, and each which() stats a candidate in
+# every PATH directory. A short TTL keeps "reachable right now" honest
+# while collapsing a burst of resolutions into one PATH walk.
+_WHICH_TTL_SECONDS = 2.0
+_WHICH_CACHE: dict[tuple[str, str], tuple[float, bool]] = {}
+
+
 def cli_binary_available(name: str) -> bool:
-    return shutil.which(name) is not None
+    key = (name, os.environ.get("PATH", ""))
+    now = time.monotonic()
+    cached = _WHICH_CACHE.get(key)
+    if cached is not None and now - cached[0] < _WHICH_TTL_SECONDS:
+        return cached[1]
+    found = shutil.which(name) is not None
+    _WHICH_CACHE[key] = (now, found)
+    return found
+
+
+def reset_cache() -> None:
+    """Forget cached PATH probes (useful between tests)."""
+    _WHICH_CACHE.clear()
 
 
 def env_var_set(name: str) -> bool:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 from pydantic import BaseModel, Field
 
@@ -72,6 +73,25 @@ def read_entries() -> list[LedgerEntry]:
     return entries
 
 
+def _iter_entries_newest_first(raw: str) -> Iterator[LedgerEntry]:
+    """Yield valid entries from the end of the ledger text backwards.
+
+    Walks line boundaries with rfind, so a caller that only needs the
+    tail never splits — or validates — the rest of an ever-growing file.
+    """
+    end = len(raw)
+    while end > 0:
+        start = raw.rfind("\n", 0, end) + 1
+        line = raw[start:end].strip()
+        end = start - 1
+        if not line:
+            continue
+        try:
+            yield LedgerEntry.model_validate_json(line)
+        except ValueError:
+            continue  # skip corrupt line, never fatal
+
+
 def recent_lessons(
     *,
     project_name: str | None = None,
@@ -82,11 +102,28 @@ def recent_lessons(
     Entries are filtered to `project_name` when given, then the last
     `limit` entries are taken and their lessons concatenated in order.
     """
-    entries = read_entries()
-    if project_name:
-        entries = [e for e in entries if e.project_name == project_name]
+    if limit <= 0:
+        # Degenerate slice semantics (entries[-0:] is everything) — not
+        # worth a tail scan.
+        entries = read_entries()
+        if project_name:
+            entries = [e for e in entries if e.project_name == project_name]
+        picked = entries[-limit:]
+    else:
+        try:
+            raw = ledger_path().read_text(encoding="utf-8")
+        except OSError:
+            return []
+        picked = []
+        for entry in _iter_entries_newest_first(raw):
+            if project_name and entry.project_name != project_name:
+                continue
+            picked.append(entry)
+            if len(picked) == limit:
+                break
+        picked.reverse()
     lessons: list[str] = []
-    for entry in entries[-limit:]:
+    for entry in picked:
         lessons.extend(entry.capability_lessons)
     return lessons
 
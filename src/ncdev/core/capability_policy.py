@@ -7,6 +7,7 @@ explicit pin > known alias > version table > provider default.
 
 from __future__ import annotations
 
+import re
 from functools import lru_cache
 from pathlib import Path
 
@@ -49,6 +50,11 @@ _MODEL_REJECTION_MARKERS: tuple[str, ...] = (
     "unknown model",
     "not authorized",
 )
+# One case-insensitive alternation over the markers: a single scan per
+# text part, with no lowercased copy of what may be a long transcript.
+_MODEL_REJECTION_RE = re.compile(
+    "|".join(re.escape(m) for m in _MODEL_REJECTION_MARKERS), re.IGNORECASE,
+)
 
 
 def is_model_rejection_error(*text_parts: str | None) -> bool:
@@ -56,8 +62,7 @@ def is_model_rejection_error(*text_parts: str | None) -> bool:
 
     Heuristic — the CLIs expose no machine-readable error code.
     """
-    blob = " ".join(p for p in text_parts if p).lower()
-    return any(marker in blob for marker in _MODEL_REJECTION_MARKERS)
+    return any(_MODEL_REJECTION_RE.search(p) for p in text_parts if p)
 
 
 def next_alias_down(provider: str, model: str) -> str | None:
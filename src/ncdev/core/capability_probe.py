@@ -11,6 +11,7 @@ import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ncdev.core.models import (
@@ -70,6 +71,51 @@ def _run_help(binary: str) -> str:
         return ""
 
 
+# (resolved path, mtime_ns, size) of a CLI binary -> (version, help).
+# Both outputs are a pure function of the installed binary, yet every
+# codex session and every "auto" model resolution probes again. An
+# upgrade rewrites the binary, which changes the key.
+_PROBE_CACHE: dict[tuple[str, int, int], tuple[str, str]] = {}
+
+
+def reset_cache() -> None:
+    """Forget memoised ``--version``/``--help`` probes (useful between tests)."""
+    _PROBE_CACHE.clear()
+
+
+def _binary_fingerprint(binary: str) -> tuple[str, int, int] | None:
+    path = shutil.which(binary)
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _run_version_and_help(binary: str) -> tuple[str, str]:
+    """Run `--version` and `--help` concurrently; return both raw outputs.
+
+    Both probes are almost pure process-spawn + CLI boot latency, and
+    run_codex_session probes before every session, so overlapping them
+    takes the wall clock from t_version + t_help to roughly the max.
+    Results are memoised per installed binary; only a probe where both
+    outputs came back is cached, so a transient failure of either is
+    retried.
+    """
+    key = _binary_fingerprint(binary)
+    if key is not None and key in _PROBE_CACHE:
+        return _PROBE_CACHE[key]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        version = pool.submit(_run_version, binary)
+        help_text = pool.submit(_run_help, binary)
+        outputs = version.result(), help_text.result()
+    if key is not None and all(outputs):
+        _PROBE_CACHE[key] = outputs
+    return outputs
+
+
 def scan_installed_skills(workspace: Path | None = None) -> list[str]:
     """Return sorted, de-duplicated names of installed Claude skills.
 
@@ -107,7 +153,8 @@ def probe_claude() -> ProviderCapabilitySnapshot:
             available=False,
             notes=["claude CLI not found on PATH"],
         )
-    version = detect_cli_version(_run_version("claude"))
+    raw_version, raw_help = _run_version_and_help("claude")
+    version = detect_cli_version(raw_version)
     snap = ProviderCapabilitySnapshot(
         provider="anthropic_claude_code",
         model=CLAUDE_MODEL_ALIASES[0],
@@ -123,7 +170,7 @@ def probe_claude() -> ProviderCapabilitySnapshot:
         ),
         notes=[f"accepted model aliases: {', '.join(CLAUDE_MODEL_ALIASES)}"],
     )
-    flags = parse_supported_flags(_run_help("claude"))
+    flags = parse_supported_flags(raw_help)
     if flags:
         snap.notes.append(f"flags: {', '.join(flags)}")
     return snap
@@ -138,7 +185,8 @@ def probe_codex() -> ProviderCapabilitySnapshot:
             available=False,
             notes=["codex CLI not found on PATH"],
         )
-    version = detect_cli_version(_run_version("codex"))
+    raw_version, raw_help = _run_version_and_help("codex")
+    version = detect_cli_version(raw_version)
     snap = ProviderCapabilitySnapshot(
         provider="openai_codex",
         model=CODEX_DEFAULT_MODEL,
@@ -152,7 +200,7 @@ def probe_codex() -> ProviderCapabilitySnapshot:
         ),
         notes=["reasoning via config key model_reasoning_effort"],
     )
-    flags = parse_supported_flags(_run_help("codex"))
+    flags = parse_supported_flags(raw_help)
     if flags:
         snap.notes.append(f"flags: {', '.join(flags)}")
     return snap
@@ -164,7 +212,11 @@ def probe_toolchain(workspace: Path | None = None) -> CapabilitySnapshotDoc:
     Never raises — a failed sub-probe is recorded in that provider's
     snapshot.notes and the snapshot is marked unavailable.
     """
-    snapshots = [probe_claude(), probe_codex()]
+    # The two providers are independent — probe them side by side.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        claude = pool.submit(probe_claude)
+        codex = pool.submit(probe_codex)
+        snapshots = [claude.result(), codex.result()]
     skills = scan_installed_skills(workspace)
     for snap in snapshots:
         if snap.provider == "anthropic_claude_code" and snap.available:
@@ -203,7 +255,7 @@ def persist_capability_snapshot(workspace: Path) -> Path:
 def load_snapshot(path: Path) -> CapabilitySnapshotDoc | None:
     """Load a persisted snapshot, or None if missing/corrupt."""
     try:
-        raw = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except OSError:
         return None
     try:
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -44,7 +45,7 @@ from ncdev.core.sentinel_safety import SentinelSafetyGate
 from ncdev.factory import run_factory_with_bundle
 from ncdev.sentinel_charter import synthesize_charter_from_sentinel_report
 from ncdev.sentinel_reproduce import _run_test_file, reproduce_failure
-from ncdev.utils import make_run_id
+from ncdev.utils import make_run_id, read_git_head
 
 
 def _set_task(state: SentinelRunState, name: str, status: SentinelTaskStatus, message: str = "", artifacts: list[str] | None = None) -> None:
@@ -151,16 +152,9 @@ def _clone_and_checkout(
     if clone_result.returncode != 0:
         return False, _git_failure_message("git clone", clone_result)
 
-    checkout_result = _run_git(
-        ["checkout", report.service.git_sha],
-        cwd=checkout_dir,
-        timeout=120,
-    )
-    if checkout_result.returncode != 0:
-        return False, _git_failure_message("git checkout", checkout_result)
-
+    # One spawn: create the fix branch at the reported SHA and check it out.
     branch_result = _run_git(
-        ["checkout", "-b", fix_branch],
+        ["checkout", "-b", fix_branch, report.service.git_sha],
         cwd=checkout_dir,
         timeout=120,
     )
@@ -171,6 +165,9 @@ def _clone_and_checkout(
 
 
 def _git_head(repo_dir: Path) -> str | None:
+    head = read_git_head(repo_dir)
+    if head:
+        return head
     result = _run_git(["rev-parse", "HEAD"], cwd=repo_dir, timeout=30)
     if result.returncode != 0:
         return None
@@ -178,19 +175,22 @@ def _git_head(repo_dir: Path) -> str | None:
 
 
 def _diff_scope(repo_dir: Path, base_sha: str) -> tuple[int, int, list[str], str]:
-    stat_result = _run_git(["diff", "--stat", f"{base_sha}..HEAD"], cwd=repo_dir)
-    if stat_result.returncode != 0:
-        return 0, 0, [], _git_failure_message("git diff --stat", stat_result)
-
-    numstat_result = _run_git(["diff", "--numstat", f"{base_sha}..HEAD"], cwd=repo_dir)
-    if numstat_result.returncode != 0:
-        return 0, 0, [], _git_failure_message("git diff --numstat", numstat_result)
+    # One diff produces both views: the tab-separated numstat rows come
+    # first, then the --stat block, whose lines never contain a raw tab
+    # (git quotes such paths).
+    diff_result = _run_git(
+        ["diff", "--numstat", "--stat", f"{base_sha}..HEAD"], cwd=repo_dir,
+    )
+    if diff_result.returncode != 0:
+        return 0, 0, [], _git_failure_message("git diff --stat", diff_result)
 
     paths: list[str] = []
+    stat_lines: list[str] = []
     lines_changed = 0
-    for line in numstat_result.stdout.splitlines():
+    for line in diff_result.stdout.splitlines():
         parts = line.split("\t")
         if len(parts) < 3:
+            stat_lines.append(line)
             continue
         added, deleted, path = parts[0], parts[1], parts[2]
         paths.append(path)
@@ -199,7 +199,7 @@ def _diff_scope(repo_dir: Path, base_sha: str) -> tuple[int, int, list[str], str
         if deleted.isdigit():
             lines_changed += int(deleted)
 
-    return len(paths), lines_changed, paths, stat_result.stdout.strip()
+    return len(paths), lines_changed, paths, "\n".join(stat_lines).strip()
 
 
 def _rerun_reproduction_test(repo_dir: Path, test_path: str) -> tuple[bool, str]:
@@ -587,15 +587,21 @@ def run_sentinel_fix(
         _set_task(state, "verify", SentinelTaskStatus.RUNNING)
         _set_task(state, "validate", SentinelTaskStatus.RUNNING)
         _persist_progress(state)
-        repro_passed, repro_output = _rerun_reproduction_test(
-            checkout_dir,
-            repro_test_path or "",
-        )
-        head_sha = _git_head(checkout_dir)
-        files_count, lines_changed, changed_paths, diff_detail = _diff_scope(
-            checkout_dir,
-            report.service.git_sha,
-        )
+        # The git queries compare commits and never touch the working
+        # tree, so they run while the reproduction test does.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            head_future = pool.submit(_git_head, checkout_dir)
+            scope_future = pool.submit(
+                _diff_scope,
+                checkout_dir,
+                report.service.git_sha,
+            )
+            repro_passed, repro_output = _rerun_reproduction_test(
+                checkout_dir,
+                repro_test_path or "",
+            )
+            head_sha = head_future.result()
+            files_count, lines_changed, changed_paths, diff_detail = scope_future.result()
         files_changed = changed_paths
         state.metadata.update({
             "files_changed": files_count,
@@ -20,7 +20,9 @@ from ncdev.core.config import SentinelServiceConfig, validate_service_for_deploy
 from ncdev.core.models import SentinelFailureReport
 
 
-@dataclass
+# Step results are slotted: one of each is built per fix attempt and
+# kept on the run record.
+@dataclass(slots=True)
 class DeployResult:
     ok: bool
     pr_url: str = ""
@@ -33,7 +35,7 @@ class DeployResult:
     steps: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RollbackResult:
     ok: bool
     reverted_to: str = ""
@@ -42,7 +44,7 @@ class RollbackResult:
     steps: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingVerification:
     verified: bool
     staging_reachable: bool = False
@@ -123,13 +125,11 @@ def _probe_url(url: str) -> bool:
 
 def _run_repro_test(repo_dir: Path, test_path: str, env: dict[str, str]) -> bool:
     """Run the reproduction test with the supplied environment."""
-    merged_env = os.environ.copy()
-    merged_env.update(env)
     try:
         completed = subprocess.run(
             ["python", "-m", "pytest", test_path, "-q"],
             cwd=repo_dir,
-            env=merged_env,
+            env={**os.environ, **env} if env else None,
             capture_output=True,
             check=False,
             text=True,
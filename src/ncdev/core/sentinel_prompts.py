@@ -87,10 +87,9 @@ def _slugify(text: str) -> str:
 def _format_related(related: dict[str, str]) -> str:
     if not related:
         return "(none)"
-    parts: list[str] = []
-    for path, content in related.items():
-        parts.append(f"### {path}\n{content}")
-    return "\n\n".join(parts)
+    return "\n\n".join(
+        f"### {path}\n{content}" for path, content in related.items()
+    )
 
 
 def build_reproduction_prompt(
@@ -102,7 +102,7 @@ class CooldownTracker:
         return elapsed < self.cooldown_seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyVerdict:
     allowed: bool
     reason: str = ""
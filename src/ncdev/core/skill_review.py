@@ -7,7 +7,6 @@ gate, it does not replace it.
 
 from __future__ import annotations
 
-import json
 import re
 from collections.abc import Callable
 from pathlib import Path
@@ -15,6 +14,8 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from ncdev.utils import loads_last_json_object
+
 _FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
 
 
@@ -60,7 +61,7 @@ def review_skill_candidate(
     text = getattr(result, "final_text", "") or ""
     cleaned = _FENCE_RE.sub("", text.strip()).strip()
     try:
-        data = json.loads(cleaned)
+        data = loads_last_json_object(cleaned)
         return SkillReview(approved=bool(data["approved"]),
                            reasoning=str(data.get("reasoning", "")))
     except (ValueError, KeyError, TypeError):
@@ -27,6 +27,12 @@ _WORK_TYPE_SKILLS: dict[str, list[str]] = {
     ],
 }
 
+# Every vetted skill name, for scanning lesson text. Built once rather
+# than re-flattened for every lesson.
+_ALL_SKILLS: frozenset[str] = frozenset(
+    s for skills in _WORK_TYPE_SKILLS.values() for s in skills
+)
+
 
 def work_type_for(*, is_brownfield: bool, touches_frontend: bool) -> str:
     """Classify a feature build into a work type.
@@ -50,9 +56,7 @@ def _skills_flagged_hurt(lessons: list[str]) -> set[str]:
         low = lesson.lower()
         if "hurt" not in low:
             continue
-        for skill in {s for skills in _WORK_TYPE_SKILLS.values() for s in skills}:
-            if skill in low:
-                flagged.add(skill)
+        flagged.update(skill for skill in _ALL_SKILLS if skill in low)
     return flagged
 
 
@@ -32,12 +32,12 @@ from pathlib import Path
 from typing import Any
 
 from rich.console import Console
-from rich.panel import Panel
 
 from ncdev.ai_session import run_ai_session
 from ncdev.claude_session import DEFAULT_BUILD_TOOLS
 from ncdev.preflight import require_citex
 from ncdev.core.config import NCDevConfig, load_config
+from ncdev.utils import read_git_head
 
 console = Console()
 
@@ -123,6 +123,9 @@ def _ensure_git_repo(project_path: Path, mode: str) -> None:
 
 
 def _git_head(project_path: Path) -> str:
+    head = read_git_head(project_path)
+    if head:
+        return head
     r = subprocess.run(
         ["git", "rev-parse", "HEAD"],
         cwd=str(project_path), capture_output=True, text=True, timeout=5,
@@ -309,12 +312,14 @@ def run_dev(
     preflight, git repo setup, session orchestration, broken-tag
     fallback on failure, Citex ingestion of the run summary.
     """
-    start = time.time()
+    start = time.perf_counter()
     project_id = project_path.name
     run_id = f"dev-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}"
 
     require_citex(CITEX_API)
 
+    from rich.panel import Panel
+
     console.print(Panel(
         f"[bold cyan]NC Dev System — thin orchestrator[/bold cyan]\n"
         f"Project: {project_path}\n"
@@ -433,7 +438,7 @@ def run_dev(
             f"to codex_only if delegation is required.[/yellow]"
         )
 
-    duration = time.time() - start
+    duration = time.perf_counter() - start
 
     # Ingest short run summary to Citex (best-effort; do not fail the run)
     try:
@@ -27,7 +27,6 @@ from pathlib import Path
 from typing import Any
 
 from rich.console import Console
-from rich.panel import Panel
 
 from ncdev.core.config import NCDevConfig
 from ncdev.pipeline.charter import generate_charter, load_charter, write_charter
@@ -47,7 +46,7 @@ from ncdev.pipeline.product_steward import (
 )
 from ncdev.quality_gate.config import QualityGateConfig
 from ncdev.quality_gate.orchestrator import QualityGateOrchestrator
-from ncdev.utils import make_run_id
+from ncdev.utils import make_run_id, read_git_head, read_text_cached
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -88,8 +87,9 @@ def surface_skill_candidates() -> None:
         "[bold]Skill candidates detected[/bold] — recurring patterns in the "
         "capability ledger:"
     )
-    for c in candidates:
-        console.print(f"  - {c.pattern}  [dim](x{c.occurrences})[/dim]")
+    console.print("\n".join(
+        f"  - {c.pattern}  [dim](x{c.occurrences})[/dim]" for c in candidates
+    ))
     console.print(
         "  Consider authoring a skill: "
         "[cyan]ncdev skill-author --name <name> --pattern \"<pattern>\"[/cyan]"
@@ -132,6 +132,9 @@ def _files_changed_in_cycle(
 
 def _git_head(target_repo: Path) -> str | None:
     """Return current HEAD SHA, or None on failure."""
+    head = read_git_head(target_repo)
+    if head:
+        return head
     import subprocess
 
     try:
@@ -160,7 +163,9 @@ async def _probe_test_craftr_async(
 ) -> tuple[str | None, list[dict[str, Any]], dict[str, Any]]:
     config = QualityGateConfig(test_craftr_url=test_craftr_url)
     orchestrator = QualityGateOrchestrator(config)
-    prd_content = source_path.read_text(encoding="utf-8")
+    # Re-probed every factory cycle with the same PRD — read it once,
+    # off the event loop.
+    prd_content = await asyncio.to_thread(read_text_cached, source_path)
     run_id = await orchestrator.trigger_test_run(
         target_url=target_url,
         prd_content=prd_content,
@@ -528,6 +533,8 @@ def _run_factory_cycle_loop(
     pipeline_run_id: str | None = None,
     skip_charter: bool = False,
 ) -> FactoryRunState:
+    from rich.panel import Panel
+
     for cycle in range(1, max_cycles + 1):
         console.print(Panel(
             f"[bold cyan]Factory cycle {cycle}/{max_cycles}[/bold cyan]",
@@ -7,7 +7,7 @@ from __future__ import annotations
 import json
 import threading
 from collections.abc import AsyncIterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Callable
@@ -36,7 +36,12 @@ def create_app(
     except Exception:  # noqa: BLE001
         config = NCDevConfig()
     max_concurrent = max(1, int(config.sentinel.intake.max_concurrent_runs))
+    # Exactly max_concurrent workers draining the executor's work queue.
+    # A queued run costs one registry entry and a path — the report is
+    # already on disk — however large the backlog grows.
     executor = ThreadPoolExecutor(max_workers=max_concurrent)
+    # Futures of runs not yet finished, keyed like run_registry.
+    pending: dict[str, Future[None]] = {}
     shared_gate = SentinelSafetyGate()
 
     @asynccontextmanager
@@ -44,7 +49,21 @@ def create_app(
         try:
             yield
         finally:
-            executor.shutdown(wait=False)
+            # Drop runs that never started instead of letting them build
+            # after the API is gone; in-flight runs finish on their own.
+            # Future.cancel() only succeeds for a run no worker has taken,
+            # so a run picked up but not yet marked "running" is not
+            # reported as cancelled.
+            cancelled_at = _utc_now().isoformat()
+            with lock:
+                for run_id, future in pending.items():
+                    if future.cancel():
+                        entry = run_registry[run_id]
+                        entry["status"] = "failed"
+                        entry["completed_at"] = cancelled_at
+                        entry["error"] = "cancelled: intake API shut down before the run started"
+                pending.clear()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     app = FastAPI(title="NC Dev System — Sentinel Intake API", lifespan=lifespan)
 
@@ -102,6 +121,9 @@ def create_app(
                 entry["status"] = "failed"
                 entry["completed_at"] = _utc_now().isoformat()
                 entry["error"] = str(exc)
+        finally:
+            with lock:
+                pending.pop(run_id, None)
 
     @app.get("/api/v1/health")
     def health() -> dict[str, Any]:
@@ -130,7 +152,8 @@ def create_app(
                 },
             )
 
-        run_id = f"fix-{report.report_id}-{_utc_now().strftime('%Y%m%d-%H%M%S')}"
+        queued_at = _utc_now()
+        run_id = f"fix-{report.report_id}-{queued_at.strftime('%Y%m%d-%H%M%S')}"
         report_path = workspace / ".nc-dev" / "intake" / run_id / "report.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
         report_path.write_text(
@@ -142,10 +165,11 @@ def create_app(
                 "run_id": run_id,
                 "report_id": report.report_id,
                 "status": "queued",
-                "queued_at": _utc_now().isoformat(),
+                "queued_at": queued_at.isoformat(),
                 "report_path": str(report_path),
             }
-        executor.submit(_execute, run_id, report_path)
+            # Registered under the lock, so _execute's pop cannot run first.
+            pending[run_id] = executor.submit(_execute, run_id, report_path)
 
         return JSONResponse(
             status_code=202,
@@ -42,7 +42,7 @@ def load_feature_manifest(project_root: Path, feature_id: str) -> AssetManifest
     if not path.exists():
         return None
     try:
-        return AssetManifest.model_validate_json(path.read_text(encoding="utf-8"))
+        return AssetManifest.model_validate_json(path.read_bytes())
     except Exception:  # noqa: BLE001
         return None
 
@@ -65,7 +65,7 @@ def aggregate_manifests(project_root: Path) -> AssetManifest:
             if path.name in ("_all.json", "_summary.json"):
                 continue
             try:
-                m = AssetManifest.model_validate_json(path.read_text(encoding="utf-8"))
+                m = AssetManifest.model_validate_json(path.read_bytes())
             except Exception:  # noqa: BLE001
                 continue
             for asset in m.assets:
@@ -136,16 +136,21 @@ Rules:
 # ---------------------------------------------------------------------------
 
 
+# Every literal in the patterns below is ASCII, so case-insensitive
+# matching only needs ASCII case folding; Unicode folding made each
+# search roughly 1.7x slower. Identifiers stay Unicode via (?u:...).
+_ASSET_REF_FLAGS = re.IGNORECASE | re.ASCII
+
 # Patterns that signal an asset reference in source code
 _ASSET_REFERENCE_PATTERNS: tuple[re.Pattern, ...] = (
     # HTML/JSX: <img src="...">, <video src="...">, poster="..."
-    re.compile(r"""<(?:img|video|audio|source)\s+[^>]*(?:src|poster)\s*=\s*["']([^"']+)["']""", re.IGNORECASE),
+    re.compile(r"""<(?:img|video|audio|source)\s+[^>]*(?:src|poster)\s*=\s*["']([^"']+)["']""", _ASSET_REF_FLAGS),
     # JSX/TS import of image: import foo from "./foo.png"
-    re.compile(r"""import\s+\w+\s+from\s+["']([^"']+\.(?:png|jpe?g|webp|gif|svg|mp4|webm|mp3|wav|ogg|ico))["']""", re.IGNORECASE),
+    re.compile(r"""import\s+(?u:\w+)\s+from\s+["']([^"']+\.(?:png|jpe?g|webp|gif|svg|mp4|webm|mp3|wav|ogg|ico))["']""", _ASSET_REF_FLAGS),
     # CSS: background(-image): url("...")
-    re.compile(r"""url\(\s*["']?([^"')\s]+\.(?:png|jpe?g|webp|gif|svg|mp4|webm|ico))["']?\s*\)""", re.IGNORECASE),
+    re.compile(r"""url\(\s*["']?([^"')\s]+\.(?:png|jpe?g|webp|gif|svg|mp4|webm|ico))["']?\s*\)""", _ASSET_REF_FLAGS),
     # Next/Image src, React require: require("./foo.png")
-    re.compile(r"""require\(\s*["']([^"']+\.(?:png|jpe?g|webp|gif|svg|mp4|webm|mp3|wav|ogg|ico))["']\s*\)""", re.IGNORECASE),
+    re.compile(r"""require\(\s*["']([^"']+\.(?:png|jpe?g|webp|gif|svg|mp4|webm|mp3|wav|ogg|ico))["']\s*\)""", _ASSET_REF_FLAGS),
 )
 
 _CODE_EXTENSIONS: tuple[str, ...] = (
@@ -155,6 +160,29 @@ _CODE_EXTENSIONS: tuple[str, ...] = (
 )
 
 
+def _asset_refs_in_text(text: str) -> list[tuple[str, int]]:
+    """``(referenced_asset, line_number)`` for every reference in ``text``.
+
+    References are matched line by line, but most code files contain
+    none — one whole-text search per pattern (a C-level pass) rules
+    those out before the per-line Python loop. The patterns carry no
+    anchors, so a match inside any line is also a match in the whole
+    text and the prefilter never drops a hit.
+    """
+    if not any(pat.search(text) for pat in _ASSET_REFERENCE_PATTERNS):
+        return []
+    refs: list[tuple[str, int]] = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        for pat in _ASSET_REFERENCE_PATTERNS:
+            for m in pat.finditer(line):
+                ref = m.group(1)
+                # Skip absolute URLs — they're external, not repo assets
+                if ref.startswith(("http://", "https://", "data:", "//")):
+                    continue
+                refs.append((ref, lineno))
+    return refs
+
+
 def scan_code_for_asset_references(
     project_root: Path,
     *,
@@ -182,14 +210,7 @@ def scan_code_for_asset_references(
         except OSError:
             continue
         rel = str(fp.relative_to(project_root))
-        for lineno, line in enumerate(text.splitlines(), start=1):
-            for pat in _ASSET_REFERENCE_PATTERNS:
-                for m in pat.finditer(line):
-                    ref = m.group(1)
-                    # Skip absolute URLs — they're external, not repo assets
-                    if ref.startswith(("http://", "https://", "data:", "//")):
-                        continue
-                    hits.append((rel, ref, lineno))
+        hits.extend((rel, ref, lineno) for ref, lineno in _asset_refs_in_text(text))
     return hits
 
 
@@ -212,13 +233,7 @@ def scan_files_for_asset_references(
             text = fp.read_text(encoding="utf-8", errors="ignore")
         except OSError:
             continue
-        for lineno, line in enumerate(text.splitlines(), start=1):
-            for pat in _ASSET_REFERENCE_PATTERNS:
-                for m in pat.finditer(line):
-                    ref = m.group(1)
-                    if ref.startswith(("http://", "https://", "data:", "//")):
-                        continue
-                    hits.append((rel, ref, lineno))
+        hits.extend((rel, ref, lineno) for ref, lineno in _asset_refs_in_text(text))
     return hits
 
 
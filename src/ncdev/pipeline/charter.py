@@ -17,6 +17,7 @@ the three files directly into ``run_dir/outputs/``.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from ncdev.ai_session import run_ai_session
@@ -152,8 +153,13 @@ the files and confirm.
 """
 
 
+@lru_cache(maxsize=None)
 def _schema_excerpt(model_cls) -> str:
-    """Render a compact JSON-schema hint for a pydantic model."""
+    """Render a compact JSON-schema hint for a pydantic model.
+
+    Cached per class: model_json_schema() walks the whole model graph,
+    and every charter attempt (retries included) re-renders the prompt.
+    """
     schema = model_cls.model_json_schema()
     props = schema.get("properties", {})
     lines = []
@@ -260,6 +266,9 @@ def generate_charter(
 
     last_session: ClaudeSessionResult | None = None
     last_violations: list[str] = []
+    # A negative budget still means one session; without the clamp the
+    # loop body never runs and the fall-through assert fires.
+    max_retries = max(max_retries, 0)
 
     for attempt in range(max_retries + 1):
         prompt = base_prompt
@@ -382,14 +391,15 @@ def load_charter(output_dir: Path, *, strict: bool = True) -> CharterBundle:
         if not p.exists():
             raise FileNotFoundError(f"Charter artifact missing: {p}")
 
+    # Bytes straight into the pydantic-core parser — no intermediate str.
     contract = TargetProjectContract.model_validate_json(
-        contract_path.read_text(encoding="utf-8"),
+        contract_path.read_bytes(),
     )
     verification = VerificationContract.model_validate_json(
-        verification_path.read_text(encoding="utf-8"),
+        verification_path.read_bytes(),
     )
     feature_queue = FeatureQueueDoc.model_validate_json(
-        feature_queue_path.read_text(encoding="utf-8"),
+        feature_queue_path.read_bytes(),
     )
 
     bundle = CharterBundle(
@@ -28,15 +28,23 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+import stat
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any
+
+try:
+    import re2 as _re2
+except ImportError:  # pragma: no cover - optional speedup
+    _re2 = None
 
 from ncdev.ai_session import run_ai_session
-from ncdev.claude_session import (
-    DEFAULT_BUILD_TOOLS,
-)
+from ncdev.claude_session import DEFAULT_BUILD_TOOLS
 from ncdev.core.config import NCDevConfig
 from ncdev.pipeline.asset_manifest import (
     manifest_prompt_section,
@@ -50,6 +58,7 @@ from ncdev.pipeline.models import (
     StepVerification,
     TestResult,
 )
+from ncdev.utils import read_git_head, run_shell
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +68,40 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+# implementer_mode -> (intro paragraph, workflow step 5). Invariant
+# text, so it lives here rather than being rebuilt for every prompt.
+_IMPLEMENTER_BLOCKS: dict[str, tuple[str, str]] = {
+    "claude": (
+        "You are running in claude_only mode — there is NO Codex peer in "
+        "this session. Do all implementation and test writing yourself "
+        "with Edit/Write/Bash. Do not invoke `codex exec`.",
+        "**Implement directly.** Use Edit/Write to author production code "
+        "and tests. Run tests with Bash.",
+    ),
+    "codex": (
+        "You have the Claude skill machinery available; use it. Codex is "
+        "your implementation peer (see the Codex protocol in your system "
+        "prompt) — delegate raw implementation and test writing to Codex "
+        "via Bash, keep judgment and review yourself.",
+        "**Delegate implementation to Codex via Bash.** One well-scoped "
+        "Codex call per sub-task is better than five vague ones. Review "
+        "Codex's output yourself before moving on.",
+    ),
+}
+
+# Fallback lines for empty spec sections. An empty list skips the
+# bullet join and the section falls straight through to these.
+_NO_PRIOR_FEATURES = "No prior features — this is the first build in the queue."
+_NO_ACCEPTANCE_CRITERIA = "- (none specified — infer from description)"
+_NO_TEST_REQUIREMENTS = (
+    "- (use your judgment — tests MUST exist and verify behaviour, not just syntax)"
+)
+
+
+def _bullets(items: list[str], fallback: str) -> str:
+    return "\n".join(f"- {item}" for item in items) if items else fallback
+
+
 def build_feature_prompt(
     feature: FeatureStep,
     target_path: Path,
@@ -82,7 +125,7 @@ def build_feature_prompt(
     that won't work.
     """
     prior_block = (
-        "No prior features — this is the first build in the queue."
+        _NO_PRIOR_FEATURES
         if not prior_feature_ids
         else f"Prior features already built and verified: {', '.join(prior_feature_ids)}"
     )
@@ -110,28 +153,9 @@ def build_feature_prompt(
         ]
     )
 
-    if implementer_mode == "claude":
-        impl_paragraph = (
-            "You are running in claude_only mode — there is NO Codex peer in "
-            "this session. Do all implementation and test writing yourself "
-            "with Edit/Write/Bash. Do not invoke `codex exec`."
-        )
-        impl_step = (
-            "**Implement directly.** Use Edit/Write to author production code "
-            "and tests. Run tests with Bash."
-        )
-    else:
-        impl_paragraph = (
-            "You have the Claude skill machinery available; use it. Codex is "
-            "your implementation peer (see the Codex protocol in your system "
-            "prompt) — delegate raw implementation and test writing to Codex "
-            "via Bash, keep judgment and review yourself."
-        )
-        impl_step = (
-            "**Delegate implementation to Codex via Bash.** One well-scoped "
-            "Codex call per sub-task is better than five vague ones. Review "
-            "Codex's output yourself before moving on."
-        )
+    impl_paragraph, impl_step = _IMPLEMENTER_BLOCKS[
+        "claude" if implementer_mode == "claude" else "codex"
+    ]
 
     return f"""# Feature: {feature.feature_id} — {feature.title}
 
@@ -158,7 +182,7 @@ def build_feature_prompt(
 - Priority:    {feature.priority}
 
 ### Acceptance criteria (free-form, for your understanding)
-{chr(10).join(f"- {c}" for c in feature.acceptance_criteria) or "- (none specified — infer from description)"}
+{_bullets(feature.acceptance_criteria, _NO_ACCEPTANCE_CRITERIA)}
 
 ### Structured acceptance (ENFORCED by the verifier)
 
@@ -169,7 +193,7 @@ the run by default. Plan your work so each clause is satisfied.
 {accept_block}
 
 ### Test requirements
-{chr(10).join(f"- {t}" for t in feature.test_requirements) or "- (use your judgment — tests MUST exist and verify behaviour, not just syntax)"}
+{_bullets(feature.test_requirements, _NO_TEST_REQUIREMENTS)}
 
 ### Depends on
 {", ".join(feature.depends_on_features) if feature.depends_on_features else "(none)"}
@@ -269,55 +293,64 @@ def execute_feature_claude_driven(
     cfg_mode = config.mode if config is not None else "claude_plan_codex_build"
     implementer_mode = "claude" if cfg_mode in {"claude_only"} else "codex"
 
-    prompt = build_feature_prompt(
-        feature=feature,
-        target_path=target_path,
-        charter_dir=charter_dir,
-        prior_feature_ids=prior_ids,
-        project_id=project_id,
-        citex_url=citex_url,
-        implementer_mode=implementer_mode,
-    )
-    (step_dir / "prompt.md").write_text(prompt, encoding="utf-8")
-
-    # Snapshot git state so we can detect what changed
-    pre_commit = _git_head(target_path)
-
-    start = time.time()
     from ncdev.core.capability_ledger import recent_lessons
-    from ncdev.core.capability_probe import scan_installed_skills
+    from ncdev.core.capability_policy import resolve_model
+    from ncdev.core.capability_probe import probe_codex, scan_installed_skills
     from ncdev.core.skill_selector import (
         render_skill_block,
         select_skills,
         work_type_for,
     )
 
-    # Best-effort work-type classification. If the feature/charter objects
-    # in scope expose a clear brownfield or frontend signal, use it; if
-    # not, default to False -- that yields a safe "greenfield_backend"
-    # skill set and never crashes.
-    _is_brownfield = bool(charter_bundle.contract.is_brownfield or charter_bundle.contract.existing_repo_path)
-    _touches_frontend = bool(charter_bundle.contract.frontend_framework or charter_bundle.verification.frontend_test_command)
-    _work_type = work_type_for(
-        is_brownfield=_is_brownfield, touches_frontend=_touches_frontend
-    )
-    _selected_skills = select_skills(
-        _work_type,
-        scan_installed_skills(target_path),
-        lessons=recent_lessons(project_name=charter_bundle.contract.project_name),
-    )
-    _skill_block = render_skill_block(_selected_skills)
+    # The git snapshot and the Codex probe (a subprocess pair on a cold
+    # cache) don't depend on the prompt or skill selection below — run
+    # them alongside instead of in front of it.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Snapshot git state so we can detect what changed
+        head_future = pool.submit(_git_head, target_path)
+        codex_future = (
+            pool.submit(probe_codex) if implementer_mode == "codex" else None
+        )
 
-    # Record what the builder capability resolved to, for the ledger.
-    from ncdev.core.capability_probe import probe_codex
-    from ncdev.core.capability_policy import resolve_model
+        prompt = build_feature_prompt(
+            feature=feature,
+            target_path=target_path,
+            charter_dir=charter_dir,
+            prior_feature_ids=prior_ids,
+            project_id=project_id,
+            citex_url=citex_url,
+            implementer_mode=implementer_mode,
+        )
+        (step_dir / "prompt.md").write_text(prompt, encoding="utf-8")
+
+        start = time.perf_counter()
+
+        # Best-effort work-type classification. If the feature/charter objects
+        # in scope expose a clear brownfield or frontend signal, use it; if
+        # not, default to False -- that yields a safe "greenfield_backend"
+        # skill set and never crashes.
+        _is_brownfield = bool(charter_bundle.contract.is_brownfield or charter_bundle.contract.existing_repo_path)
+        _touches_frontend = bool(charter_bundle.contract.frontend_framework or charter_bundle.verification.frontend_test_command)
+        _work_type = work_type_for(
+            is_brownfield=_is_brownfield, touches_frontend=_touches_frontend
+        )
+        _selected_skills = select_skills(
+            _work_type,
+            scan_installed_skills(target_path),
+            lessons=recent_lessons(project_name=charter_bundle.contract.project_name),
+        )
+        _skill_block = render_skill_block(_selected_skills)
+
+        pre_commit = head_future.result()
+        codex_snapshot = codex_future.result() if codex_future else None
 
+    # Record what the builder capability resolved to, for the ledger.
     _resolved_provider = (
         "openai_codex" if implementer_mode == "codex" else "anthropic_claude_code"
     )
     _resolved_model = (
-        resolve_model("openai_codex", model, probe_codex())
-        if implementer_mode == "codex"
+        resolve_model("openai_codex", model, codex_snapshot)
+        if codex_snapshot is not None
         else "auto"
     )
 
@@ -334,31 +367,44 @@ def execute_feature_claude_driven(
         log_path=step_dir / "session.jsonl",
         append_system_prompt=_skill_block or None,
     )
-    build_duration = time.time() - start
+    build_duration = time.perf_counter() - start
 
     # Save session summary for debugging
     (step_dir / "session-summary.txt").write_text(session.summary(), encoding="utf-8")
     if session.final_text:
         (step_dir / "final-response.md").write_text(session.final_text, encoding="utf-8")
 
-    post_commit = _git_head(target_path)
+    post_commit, dirty = _git_head_and_dirty(target_path)
     made_commit = bool(post_commit and post_commit != pre_commit)
-    dirty = _git_working_tree_dirty(target_path)
 
     # Files the feature actually touched — used for feature-local asset
     # manifest verification so one legacy unmanaged asset elsewhere in
-    # the repo doesn't fail every future feature.
-    feature_files_created, feature_files_modified = _diff_since(target_path, pre_commit)
+    # the repo doesn't fail every future feature. With no new commit
+    # the pre..HEAD range is empty, so skip the spawn.
+    feature_files_created, feature_files_modified = (
+        _diff_since(target_path, pre_commit) if made_commit else ([], [])
+    )
     touched = feature_files_created + feature_files_modified
 
     # Post-hoc verification (Claude's own verification-before-completion
     # skill should have caught most things; this is our belt-and-braces)
+    #
+    # Without a commit the step is FAILED whatever verification says
+    # (both PASSED branches below require made_commit), so don't spend
+    # up to 10 minutes per suite plus a boot-timeout health poll proving
+    # it. The cheap file / manifest / pattern clauses still run so the
+    # failure reasons stay useful.
     verification = _post_session_verification(
         target_path, feature, charter_bundle,
-        run_test_commands=run_test_commands,
-        probe_health=probe_health,
+        run_test_commands=run_test_commands and made_commit,
+        probe_health=probe_health and made_commit,
         touched_files=touched,
     )
+    if not made_commit and (run_test_commands or probe_health):
+        verification.failure_reasons.append(
+            "session made no commit — test commands and health probe skipped"
+        )
+        verification.overall_passed = False
 
     # Decide status
     recoverability_note = ""
@@ -495,24 +541,32 @@ def _post_session_verification(
                 f"{bundle.verification.minimum_test_count}"
             )
 
-    # 6. Run the declared test commands
-    if run_test_commands:
-        if bundle.verification.backend_test_command:
-            ok, out = _run_shell(
-                bundle.verification.backend_test_command,
-                cwd=target_path, timeout=600,
+    # 6. Run the declared test commands. The backend and frontend suites
+    #    are independent subprocesses (pytest vs. the JS runner), so they
+    #    run side by side and the clause costs max(suite) rather than
+    #    the sum. Results are still read back in backend, frontend order.
+    backend_cmd = bundle.verification.backend_test_command if run_test_commands else ""
+    frontend_cmd = bundle.verification.frontend_test_command if run_test_commands else ""
+    if backend_cmd or frontend_cmd:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            backend_future = (
+                pool.submit(run_shell, backend_cmd, cwd=target_path, timeout=600)
+                if backend_cmd else None
             )
+            frontend_future = (
+                pool.submit(run_shell, frontend_cmd, cwd=target_path, timeout=600)
+                if frontend_cmd else None
+            )
+        if backend_future is not None:
+            ok, out = backend_future.result()
             ver.integration_tests = TestResult(
                 suite="backend", passed=1 if ok else 0,
                 failed=0 if ok else 1, success=ok, output=out[:2000],
             )
             if not ok:
                 reasons.append(f"backend tests failed: {_last_line(out)}")
-        if bundle.verification.frontend_test_command:
-            ok, out = _run_shell(
-                bundle.verification.frontend_test_command,
-                cwd=target_path, timeout=600,
-            )
+        if frontend_future is not None:
+            ok, out = frontend_future.result()
             ver.e2e_tests = TestResult(
                 suite="frontend", passed=1 if ok else 0,
                 failed=0 if ok else 1, success=ok, output=out[:2000],
@@ -649,6 +703,169 @@ def _file_mentions_token(path: Path, token: str) -> bool:
         return False
 
 
+_PROHIBITED_SCAN_WORKERS = 8
+# Most touched-file lists a feature can pass to ls-files as pathspecs.
+_LS_FILES_PATHSPEC_MAX = 512
+
+
+def _fuse_prohibited(
+    compiled: list[tuple[str, re.Pattern[str] | None]],
+) -> re.Pattern[str] | None:
+    """One alternation over every prohibited pattern, a named group each.
+
+    Lets a file be scanned in a single pass instead of once per pattern;
+    ``match.lastgroup`` names the pattern that hit. Substring entries are
+    escaped into the alternation. Returns None when fusing could change
+    meaning — a pattern with its own groups (numbered backreferences
+    would shift) or one that no longer compiles once embedded (inline
+    global flags) — and the caller scans pattern by pattern instead.
+    """
+    parts: list[str] = []
+    for index, (pat, regex) in enumerate(compiled):
+        if regex is not None and regex.groups:
+            return None
+        source = regex.pattern if regex is not None else re.escape(pat)
+        parts.append(f"(?P<_p{index}>{source})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _prohibited_literals(
+    compiled: list[tuple[str, re.Pattern[str] | None]],
+) -> list[bytes] | None:
+    """Byte needles, in pattern order, when every pattern is a plain literal.
+
+    The common contract (TODO, FIXME, "Not yet implemented") has no
+    regex syntax at all, and a few ``bytes.find`` passes beat running
+    the regex engine over the file. None if any entry needs the engine.
+    """
+    literals: list[bytes] = []
+    for pat, regex in compiled:
+        is_literal = regex is None or _REGEX_METACHARACTERS.isdisjoint(pat)
+        if not is_literal or not pat.isascii() or "\r" in pat or "\n" in pat:
+            return None
+        literals.append(pat.encode("ascii"))
+    return literals
+
+
+def _as_bytes_pattern(regex: re.Pattern[str]) -> re.Pattern[bytes] | None:
+    """The same pattern compiled for bytes, or None if it has no bytes form.
+
+    Only equivalent to ``regex`` on ASCII input — callers must check.
+    """
+    try:
+        return re.compile(regex.pattern.encode("utf-8"), regex.flags & ~re.UNICODE)
+    except (re.error, UnicodeEncodeError, ValueError):
+        return None
+
+
+def _as_re2(regex: re.Pattern[bytes] | None) -> Any:
+    """``regex`` under RE2 when installed and equivalent, else ``regex``.
+
+    RE2 matches in linear time, so no contract pattern can backtrack
+    exponentially over generated code. On the ASCII bytes path its
+    classes and leftmost-first alternation agree with ``re``. ``$`` does
+    not (``re`` also matches before a final newline), nor does ``[[:``
+    (a POSIX class to RE2, a literal ``[`` and ``:`` set to ``re``), so a
+    pattern using either stays on ``re``, as does anything RE2 rejects
+    (backreferences, lookaround).
+    """
+    if (
+        _re2 is None
+        or regex is None
+        or regex.flags
+        or b"$" in regex.pattern
+        or b"[[:" in regex.pattern
+    ):
+        return regex
+    try:
+        return _re2.compile(regex.pattern)
+    except Exception:  # noqa: BLE001 - re2.error, or an unsupported construct
+        return regex
+
+
+@lru_cache(maxsize=8)
+def _compile_prohibited(
+    patterns: tuple[str, ...],
+) -> tuple[
+    list[tuple[str, re.Pattern[str] | None]],
+    re.Pattern[str] | None,
+    Any,
+    list[bytes] | None,
+]:
+    """Every matcher form of one contract's prohibited patterns.
+
+    The contract is fixed for a whole run but verified after every
+    feature session; building the fused and bytes regexes once per
+    pattern set keeps that off the per-feature path.
+    """
+    compiled: list[tuple[str, re.Pattern[str] | None]] = []
+    for pat in patterns:
+        try:
+            compiled.append((pat, re.compile(pat)))
+        except re.error:
+            compiled.append((pat, None))
+    fused = _fuse_prohibited(compiled) if compiled else None
+    fused_bytes = _as_re2(_as_bytes_pattern(fused) if fused is not None else None)
+    return compiled, fused, fused_bytes, _prohibited_literals(compiled)
+
+
+def _scan_prohibited_file(root: str, f: str, patterns: tuple[str, ...]) -> str | None:
+    """The first prohibited pattern found in ``root/f``, or None.
+
+    Keyed on the pattern tuple, so every scan thread shares the matchers
+    built once by the _compile_prohibited cache.
+    """
+    compiled, fused, fused_bytes, literals = _compile_prohibited(patterns)
+    # One open + fstat on the descriptor instead of a path stat and a
+    # read_bytes() that opens and stats again; no Path per file.
+    try:
+        with open(os.path.join(root, f), "rb") as fh:
+            st = os.fstat(fh.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_size > 1_000_000:
+                return None
+            data = fh.read()
+    except OSError:
+        return None
+    # Nearly all source is pure ASCII with \n line ends. On such input
+    # the bytes form of the fused regex matches exactly what the str
+    # form would, so skip the decode and the str copy altogether.
+    if data.isascii() and b"\r" not in data:
+        if literals is not None:
+            # Earliest hit, ties to the first listed — as the fused
+            # alternation would report it.
+            found = [
+                (at, index)
+                for index, lit in enumerate(literals)
+                if (at := data.find(lit)) >= 0
+            ]
+            return compiled[min(found)[1]][0] if found else None
+        if fused_bytes is not None:
+            match = fused_bytes.search(data)
+            return compiled[int(match.lastgroup[2:])][0] if match else None
+    # What read_text(errors="ignore") would give: universal newlines.
+    text = (
+        data.decode("utf-8", errors="ignore")
+        .replace("\r\n", "\n")
+        .replace("\r", "\n")
+    )
+    if fused is not None:
+        match = fused.search(text)
+        return compiled[int(match.lastgroup[2:])][0] if match else None
+    return next(
+        (
+            pat for pat, regex in compiled
+            if (regex.search(text) if regex is not None else pat in text)
+        ),
+        None,
+    )
+
+
 def _grep_for_prohibited(
     target_path: Path,
     patterns: list[str],
@@ -659,27 +876,33 @@ def _grep_for_prohibited(
 
     Each entry is treated as a regular expression via ``re.search``. If
     a pattern fails to compile, falls back to a substring check so
-    human-written entries like ``TODO`` still work.
+    human-written entries like ``TODO`` still work. Patterns are fused
+    into one regex where possible, so the reported pattern is the one
+    matching earliest in the file.
 
     When ``touched_files`` is provided, only scan that feature-local set.
     This keeps brownfield legacy debt from failing unrelated future work.
     """
-    compiled: list[tuple[str, re.Pattern[str] | None]] = []
-    for pat in patterns:
-        try:
-            compiled.append((pat, re.compile(pat)))
-        except re.error:
-            compiled.append((pat, None))
+    key = tuple(patterns)
 
     hits: list[str] = []
     try:
+        # A feature touches a handful of paths; hand them to git as
+        # literal pathspecs so it lists just those instead of the whole
+        # index (a huge change set keeps the full listing, well clear of
+        # ARG_MAX). -z keeps unusual names unquoted so they compare equal.
+        cmd = ["git", "--literal-pathspecs", "ls-files", "-z"]
+        if touched_files is not None:
+            if not touched_files:
+                return []
+            if len(touched_files) <= _LS_FILES_PATHSPEC_MAX:
+                cmd += ["--", *touched_files]
         ls = subprocess.run(
-            ["git", "ls-files"],
-            cwd=str(target_path), capture_output=True, text=True, timeout=10,
+            cmd, cwd=str(target_path), capture_output=True, text=True, timeout=10,
         )
         if ls.returncode != 0:
             return []
-        tracked_files = {f for f in ls.stdout.splitlines() if f}
+        tracked_files = {f for f in ls.stdout.split("\0") if f}
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return []
 
@@ -688,21 +911,20 @@ def _grep_for_prohibited(
     else:
         files = sorted(tracked_files)
 
-    for f in files:
-        fp = target_path / f
-        try:
-            if fp.stat().st_size > 1_000_000:
-                continue
-            text = fp.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
-            continue
-        for pat, regex in compiled:
-            hit = regex.search(text) if regex is not None else (pat in text)
-            if hit:
-                hits.append(f"{f} contains '{pat}'")
+    scan = partial(_scan_prohibited_file, str(target_path), patterns=key)
+
+    # A full-repo scan can read thousands of files. File reads release
+    # the GIL, so a small thread pool overlaps the I/O; map() keeps file
+    # order.
+    pool = ThreadPoolExecutor(max_workers=_PROHIBITED_SCAN_WORKERS)
+    try:
+        for f, hit_pat in zip(files, pool.map(scan, files)):
+            if hit_pat is not None:   # one hit per file is enough
+                hits.append(f"{f} contains '{hit_pat}'")
                 if len(hits) > 20:
                     return hits
-                break   # one hit per file is enough
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
     return hits
 
 
@@ -767,23 +989,14 @@ def _count_test_files(target_path: Path) -> int:
     return len(seen)
 
 
-def _run_shell(cmd: str, *, cwd: Path, timeout: int) -> tuple[bool, str]:
-    """Run ``cmd`` in a shell. Returns (success, combined_output)."""
-    try:
-        r = subprocess.run(
-            cmd, shell=True, cwd=str(cwd),
-            capture_output=True, text=True, timeout=timeout,
-        )
-        return r.returncode == 0, (r.stdout + "\n" + r.stderr)
-    except subprocess.TimeoutExpired as exc:
-        return False, f"timed out after {timeout}s: {exc}"
-    except Exception as exc:  # noqa: BLE001
-        return False, f"exec error: {exc}"
-
-
 def _last_line(text: str) -> str:
-    lines = [line for line in text.strip().splitlines() if line.strip()]
-    return lines[-1][:200] if lines else "(no output)"
+    # Test-runner output can be megabytes; after rstrip() the final line
+    # is non-blank by construction, so only the tail needs looking at
+    # instead of splitting and filtering every line.
+    tail = text.rstrip()
+    cut = max(tail.rfind("\n"), tail.rfind("\r"))
+    line = tail[cut + 1:] if cut >= 0 else tail.lstrip()
+    return line[:200] if line else "(no output)"
 
 
 def _probe_health(
@@ -808,11 +1021,11 @@ def _probe_health(
     except ImportError:   # pragma: no cover - runtime dependency
         return False
 
-    deadline = time.time() + max(timeout, 1)
+    deadline = time.monotonic() + max(timeout, 1)
     attempts = 0
-    while time.time() < deadline:
+    while time.monotonic() < deadline:
         attempts += 1
-        remaining = max(deadline - time.time(), 0.1)
+        remaining = max(deadline - time.monotonic(), 0.1)
         req_timeout = min(per_request_timeout, remaining)
         try:
             r = httpx.get(url, timeout=req_timeout)
@@ -824,7 +1037,7 @@ def _probe_health(
             pass
         # Sleep until either the next poll or budget expiry, whichever
         # comes first.
-        time.sleep(min(poll_interval, max(deadline - time.time(), 0)))
+        time.sleep(min(poll_interval, max(deadline - time.monotonic(), 0)))
     return False
 
 
@@ -834,6 +1047,9 @@ def _probe_health(
 
 
 def _git_head(target_path: Path) -> str:
+    head = read_git_head(target_path)
+    if head:
+        return head
     try:
         r = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -844,23 +1060,36 @@ def _git_head(target_path: Path) -> str:
         return ""
 
 
-def _git_working_tree_dirty(target_path: Path) -> bool:
+def _git_head_and_dirty(target_path: Path) -> tuple[str, bool]:
+    """HEAD sha and whether the working tree is dirty.
+
+    HEAD comes from :func:`_git_head` (a file read in the common case),
+    never from ``git status``: a status call that fails or times out on
+    a large tree must not hide a commit the session really made. The
+    status output stays bytes, and the first entry settles ``dirty``, so
+    the rest of a large dirty tree is never decoded.
+    """
+    head = _git_head(target_path)
     try:
         r = subprocess.run(
             ["git", "status", "--porcelain"],
-            cwd=str(target_path), capture_output=True, text=True, timeout=5,
+            cwd=str(target_path), capture_output=True, timeout=5,
         )
-        return r.returncode == 0 and bool(r.stdout.strip())
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        return head, False
+    if r.returncode != 0:
+        return head, False
+    return head, any(line for line in r.stdout.split(b"\n"))
 
 
 def _diff_since(target_path: Path, ref: str) -> tuple[list[str], list[str]]:
     if not ref:
         return [], []
     try:
+        # -z: without it git quotes and octal-escapes non-ASCII or
+        # otherwise unusual names, which then match no file on disk.
         r = subprocess.run(
-            ["git", "diff", "--name-status", f"{ref}..HEAD"],
+            ["git", "diff", "--name-status", "-z", f"{ref}..HEAD"],
             cwd=str(target_path), capture_output=True, text=True, timeout=10,
         )
         if r.returncode != 0:
@@ -870,14 +1099,20 @@ def _diff_since(target_path: Path, ref: str) -> tuple[list[str], list[str]]:
 
     created: list[str] = []
     modified: list[str] = []
-    for line in r.stdout.splitlines():
-        parts = line.split("\t")
-        if len(parts) < 2:
+    # NUL-separated: status, path -- or status, old path, new path for
+    # renames and copies, whose status carries a score ("R100").
+    fields = iter(r.stdout.split("\0"))
+    for flag in fields:
+        if not flag:
+            continue
+        if flag[0] in "RC":
+            next(fields, None)
+        path = next(fields, "")
+        if not path:
             continue
-        flag, path = parts[0], parts[-1]
         if flag == "A":
             created.append(path)
-        elif flag in ("M", "R", "C"):
+        elif flag[0] in "MRC":
             modified.append(path)
     return created, modified
 
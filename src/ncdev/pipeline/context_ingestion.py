@@ -6,8 +6,6 @@ import subprocess
 from pathlib import Path
 from typing import Any, Iterable
 
-from rich.console import Console
-
 from ncdev.pipeline.citex_client import CitexClient
 from ncdev.pipeline.models import (
     FeatureQueueDoc,
@@ -17,8 +15,6 @@ from ncdev.pipeline.models import (
     StepResult,
 )
 
-console = Console()
-
 
 def ingest_project_context(
     run_dir: Path,
@@ -84,9 +80,16 @@ def ingest_project_context(
     successful = sum(1 for r in records if r.success)
     failed = sum(1 for r in records if not r.success)
 
-    for r in records:
-        status = "[green]ok[/green]" if r.success else "[red]fail[/red]"
-        console.print(f"  Citex ingest [{r.category}]: {r.char_count} chars — {status}")
+    # Deferred: the rest of this module is plain data plumbing, so only
+    # pay for rich when there is something to report.
+    if records:
+        from rich.console import Console
+
+        Console().print("\n".join(
+            f"  Citex ingest [{r.category}]: {r.char_count} chars — "
+            + ("[green]ok[/green]" if r.success else "[red]fail[/red]")
+            for r in records
+        ))
 
     return IngestionReport(
         project_id=project_id,
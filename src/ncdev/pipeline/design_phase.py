@@ -468,7 +468,7 @@ def _load_design_doc(output_dir: Path) -> DesignSystemDoc | None:
     if not path.exists():
         return None
     try:
-        return DesignSystemDoc.model_validate_json(path.read_text(encoding="utf-8"))
+        return DesignSystemDoc.model_validate_json(path.read_bytes())
     except Exception as exc:  # noqa: BLE001
         # Persist the validation error so postmortem can see WHY the
         # doc was rejected. Previous behaviour silently swallowed the
@@ -25,13 +25,14 @@ command doesn't need to change.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.console import Console, Group
 
 from ncdev.utils import make_run_id
+from ncdev.claude_session import CLI_MISSING_ERROR
 from ncdev.core.config import NCDevConfig, ensure_default_config
 from ncdev.pipeline.charter import generate_charter, load_charter
 from ncdev.pipeline.claude_executor import execute_feature_claude_driven
@@ -45,9 +46,26 @@ from ncdev.pipeline.models import (
 )
 from ncdev.pipeline.provenance import append_provenance
 
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.table import Table
+
 console = Console()
 
 
+def _panel(body: str, *, border_style: str) -> Panel | str:
+    """A bordered Panel on an interactive terminal, the bare text otherwise.
+
+    Redirected or CI output gets nothing from the box drawing, and Rich
+    still lays out and measures every panel before discarding the style.
+    """
+    if console.is_terminal and not os.environ.get("CI"):
+        from rich.panel import Panel
+
+        return Panel(body, border_style=border_style)
+    return body
+
+
 def run_pipeline(
     workspace: Path,
     source_path: Path,
@@ -102,7 +120,7 @@ def run_pipeline(
         phase="init",
     )
 
-    console.print(Panel(
+    console.print(_panel(
         f"[bold cyan]NC Dev — {config.mode} mode[/bold cyan]\n"
         f"Run ID: {run_id}\n"
         f"Source: {source_path}\n"
@@ -121,7 +139,7 @@ def run_pipeline(
         try:
             bundle = load_charter(outputs_dir, strict=False)
         except Exception as exc:  # noqa: BLE001
-            console.print(Panel(
+            console.print(_panel(
                 f"[bold red]Pre-built charter load failed[/bold red]\n"
                 f"{exc}\n"
                 f"Expected charter artifacts under: {outputs_dir}",
@@ -146,7 +164,7 @@ def run_pipeline(
             config=config,
         )
         if bundle is None:
-            console.print(Panel(
+            console.print(_panel(
                 f"[bold red]Charter generation failed[/bold red]\n"
                 f"Session: {charter_session.summary()}\n"
                 f"See: {outputs_dir}/charter-error.json (if present) "
@@ -186,7 +204,7 @@ def run_pipeline(
         if design.skipped:
             console.print("  [dim]Non-UI project — design phase skipped[/dim]")
         elif design.hard_failed:
-            console.print(Panel(
+            console.print(_panel(
                 f"[bold red]Design phase HARD FAILED[/bold red]\n"
                 f"{design.error}\n"
                 f"See: {outputs_dir}/design-phase-error.json",
@@ -254,10 +272,10 @@ def run_pipeline(
                     f"dependency not satisfied: {', '.join(unmet)} "
                     "(required feature(s) are not in PASSED state)"
                 )
-                console.print(Panel(
-                    f"[red]BLOCKED[/red] {feature.feature_id} — {reason}",
-                    border_style="red",
-                ))
+                # One line, not a Panel: a failed root feature under
+                # --continue-on-failed blocks its whole dependent subtree,
+                # and the summary table already lists every BLOCKED row.
+                console.print(f"  [red]BLOCKED[/red] {feature.feature_id} — {reason}")
                 completed.append(StepResult(
                     feature_id=feature.feature_id,
                     status=StepStatus.BLOCKED,
@@ -270,10 +288,13 @@ def run_pipeline(
                     break
                 continue
 
-            console.print(Panel(
+            # A rule, not a Panel: this prints once per feature, and the
+            # summary table at the end of the run lists every feature again.
+            console.rule(
                 f"[cyan]{feature.feature_id}[/cyan] — {feature.title}",
-                border_style="blue",
-            ))
+                style="blue",
+                align="left",
+            )
 
             result = execute_feature_claude_driven(
                 feature=feature,
@@ -317,7 +338,7 @@ def run_pipeline(
             # change exists to prevent. Pass halt_on_failed=False (CLI:
             # --continue-on-failed) only when explicitly opting in.
             if halt_on_failed and result.status == StepStatus.FAILED:
-                console.print(Panel(
+                console.print(_panel(
                     f"[bold red]HALT — feature {feature.feature_id} FAILED[/bold red]\n"
                     f"Reason(s):\n  - " + "\n  - ".join(
                         result.verification.failure_reasons[:5]
@@ -327,6 +348,20 @@ def run_pipeline(
                 ))
                 break
 
+            # A missing session CLI fails every remaining feature the same
+            # way, so stop even under --continue-on-failed rather than
+            # paying prompt build, skill scan and git snapshots for each.
+            if (
+                result.status == StepStatus.FAILED
+                and CLI_MISSING_ERROR in (result.error_message or "")
+            ):
+                console.print(_panel(
+                    f"[bold red]HALT — {result.error_message}[/bold red]\n"
+                    "Remaining features were not attempted.",
+                    border_style="red",
+                ))
+                break
+
     # ── Phase 5b: Integration gate ───────────────────────────────────────
     integration: IntegrationResult | None = None
     if not dry_run and bundle is not None and not skip_integration_gate:
@@ -348,7 +383,7 @@ def run_pipeline(
                     f"({integration.routes_probed} routes probed)"
                 )
             else:
-                console.print(Panel(
+                console.print(_panel(
                     "[bold red]Integration gate FAILED[/bold red]\n"
                     + "\n".join(f"  - {f}" for f in integration.failures[:10]),
                     border_style="red",
@@ -386,10 +421,13 @@ def run_pipeline(
     else:
         state.status = "failed"
 
-    _print_summary_table(completed)
-
+    # Render the summary as one Group so it goes through the console's
+    # render pipeline (and lock) once, not once per block.
+    summary: list = []
+    if completed:
+        summary.append(_summary_table(completed))
     if regressions:
-        console.print(Panel(
+        summary.append(_panel(
             "[bold red]Verification regression detected[/bold red]\n"
             "Features ended BLOCKED whose declared dependencies were "
             "earlier reported PASSED — that means an earlier feature's "
@@ -397,6 +435,8 @@ def run_pipeline(
             + "\n  - ".join(regressions),
             border_style="red",
         ))
+    if summary:
+        console.print(Group(*summary))
 
     _persist_state(state, run_dir)
     return state
@@ -479,35 +519,60 @@ def _filter_completed_features(target_path: Path, features, completed: list[Step
     return remaining
 
 
-def _print_summary_table(completed: list[StepResult]) -> None:
-    if not completed:
-        return
+# Rendered status cells for the summary table, built once rather than
+# re-deriving the colour map and markup for every row.
+_STATUS_MARKUP: dict[StepStatus, str] = {
+    status: f"[{colour}]{status.value}[/{colour}]"
+    for status, colour in (
+        (StepStatus.PASSED, "green"),
+        (StepStatus.FAILED, "red"),
+        (StepStatus.BLOCKED, "red"),
+        (StepStatus.SKIPPED, "yellow"),
+    )
+}
+
+
+# (header, style, justify) per summary column. Tables mutate as rows are
+# added, so only the schema is shared, not a Table instance.
+_SUMMARY_COLUMNS: tuple[tuple[str, str | None, str], ...] = (
+    ("Feature", "cyan", "left"),
+    ("Status", "bold", "left"),
+    ("Duration", None, "right"),
+    ("Files", None, "right"),
+    ("Commit", None, "right"),
+)
+
+
+def _summary_table(completed: list[StepResult]) -> Table:
+    # Imported here: only a run that built something renders a summary.
+    from rich.table import Table
+
     table = Table(title="Build Summary")
-    table.add_column("Feature", style="cyan")
-    table.add_column("Status", style="bold")
-    table.add_column("Duration", justify="right")
-    table.add_column("Files", justify="right")
-    table.add_column("Commit", justify="right")
+    for header, style, justify in _SUMMARY_COLUMNS:
+        table.add_column(header, style=style, justify=justify)
     for r in completed:
-        colour = {
-            StepStatus.PASSED: "green",
-            StepStatus.FAILED: "red",
-            StepStatus.BLOCKED: "red",
-            StepStatus.SKIPPED: "yellow",
-        }.get(r.status, "white")
         table.add_row(
             r.feature_id,
-            f"[{colour}]{r.status.value}[/{colour}]",
+            _STATUS_MARKUP.get(r.status) or f"[white]{r.status.value}[/white]",
             f"{r.build_duration_seconds:.0f}s",
             str(len(r.files_created) + len(r.files_modified)),
             r.commit_sha[:8] if r.commit_sha else "",
         )
-    console.print(table)
+    return table
 
 
 def _persist_state(state: PipelineRunState, run_dir: Path) -> None:
-    run_dir.mkdir(parents=True, exist_ok=True)
-    (run_dir / "state.json").write_text(state.model_dump_json(indent=2), encoding="utf-8")
+    # Rewritten after every feature. The model's own serializer hands
+    # back UTF-8 bytes directly; model_dump_json would decode them to str
+    # only for write_text to encode them again. run_dir almost always
+    # exists, so create it only when the write says it is missing.
+    payload = state.__pydantic_serializer__.to_json(state, indent=2)
+    path = run_dir / "state.json"
+    try:
+        path.write_bytes(payload)
+    except FileNotFoundError:
+        run_dir.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
 
 
 def _sync_progress_state(state: PipelineRunState, completed: list[StepResult]) -> None:
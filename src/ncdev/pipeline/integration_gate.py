@@ -22,21 +22,17 @@ PASSED. This is the "the whole product must work" rail.
 """
 from __future__ import annotations
 
-import subprocess
 import time
 import urllib.parse
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from rich.console import Console
-
 from ncdev.pipeline.asset_manifest import (
     aggregate_manifests,
     verify_manifest_covers_references,
 )
 from ncdev.pipeline.models import CharterBundle, StepResult, StepStatus
-
-console = Console()
+from ncdev.utils import run_shell
 
 
 @dataclass
@@ -80,7 +76,7 @@ def run_integration_gate(
     :class:`IntegrationResult` — callers (the engine) decide how to
     surface it.
     """
-    start = time.time()
+    start = time.perf_counter()
     result = IntegrationResult()
 
     # Clause 0 — bring the app up if start_command is set. The route
@@ -89,7 +85,7 @@ def run_integration_gate(
     # phases, so the gate orchestrates the lifecycle itself.
     started_here = False
     if bundle.verification.start_command and run_test_commands:
-        ok, out = _run_shell(
+        ok, out = run_shell(
             bundle.verification.start_command,
             cwd=target_path,
             timeout=300,
@@ -168,7 +164,7 @@ def run_integration_gate(
 
     # Clause 4 — backend test command
     if run_test_commands and bundle.verification.backend_test_command:
-        ok, out = _run_shell(
+        ok, out = run_shell(
             bundle.verification.backend_test_command,
             cwd=target_path,
             timeout=900,
@@ -182,7 +178,7 @@ def run_integration_gate(
 
     # Clause 5 — frontend test command
     if run_test_commands and bundle.verification.frontend_test_command:
-        ok, out = _run_shell(
+        ok, out = run_shell(
             bundle.verification.frontend_test_command,
             cwd=target_path,
             timeout=900,
@@ -196,7 +192,7 @@ def run_integration_gate(
 
     # Clause 6 — e2e test command
     if run_test_commands and bundle.verification.e2e_test_command:
-        ok, out = _run_shell(
+        ok, out = run_shell(
             bundle.verification.e2e_test_command,
             cwd=target_path,
             timeout=1800,
@@ -212,7 +208,7 @@ def run_integration_gate(
     # or unused-import / unsafe-fallback warnings still ships a
     # half-baked product; lint is part of "production complete".
     if run_test_commands and bundle.verification.lint_command:
-        ok, out = _run_shell(
+        ok, out = run_shell(
             bundle.verification.lint_command,
             cwd=target_path,
             timeout=600,
@@ -228,7 +224,7 @@ def run_integration_gate(
     # passing tests against unbuildable code is a frequent silent-skip
     # mode (frontend bundles in particular).
     if run_test_commands and bundle.verification.build_command:
-        ok, out = _run_shell(
+        ok, out = run_shell(
             bundle.verification.build_command,
             cwd=target_path,
             timeout=1800,
@@ -244,14 +240,14 @@ def run_integration_gate(
     # daemon. Teardown failure is logged but does not fail the gate;
     # the asserts above are the real signal.
     if started_here and bundle.verification.stop_command:
-        ok, out = _run_shell(
+        ok, out = run_shell(
             bundle.verification.stop_command,
             cwd=target_path,
             timeout=120,
         )
         result.app_stopped = ok
 
-    result.duration_seconds = time.time() - start
+    result.duration_seconds = time.perf_counter() - start
     result.passed = not result.failures
     return result
 
@@ -266,8 +262,8 @@ def _wait_for_health(url: str, *, timeout: int) -> bool:
         import httpx
     except ImportError:  # pragma: no cover - runtime dependency
         return False
-    deadline = time.time() + max(timeout, 5)
-    while time.time() < deadline:
+    deadline = time.monotonic() + max(timeout, 5)
+    while time.monotonic() < deadline:
         try:
             r = httpx.get(url, timeout=3)
             if 200 <= r.status_code < 400:
@@ -319,19 +315,6 @@ def _probe(url: str, *, timeout: int) -> bool:
         return False
 
 
-def _run_shell(cmd: str, *, cwd: Path, timeout: int) -> tuple[bool, str]:
-    try:
-        r = subprocess.run(
-            cmd, shell=True, cwd=str(cwd),
-            capture_output=True, text=True, timeout=timeout,
-        )
-        return r.returncode == 0, (r.stdout + "\n" + r.stderr)
-    except subprocess.TimeoutExpired as exc:
-        return False, f"timed out after {timeout}s: {exc}"
-    except Exception as exc:  # noqa: BLE001
-        return False, f"exec error: {exc}"
-
-
 def _tail(text: str, n: int = 400) -> str:
     """Return the last n chars of text — last lines are usually most useful."""
     text = text.strip()
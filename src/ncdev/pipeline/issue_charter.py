@@ -289,6 +289,12 @@ def _project_type(frontend_framework: str, backend_framework: str) -> str:
     return "web"
 
 
+_DEFAULT_FRONTEND_PORT = 23000
+_DEFAULT_BACKEND_PORT = 23001
+_COMPOSE_FILE_NAMES = ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml")
+_COMPOSE_PORT_RE = re.compile(r"['\"]?(\d{2,5}):(\d{2,5})['\"]?")
+
+
 def _infer_ports(
     target_repo: Path,
     has_frontend: bool,
@@ -299,19 +305,19 @@ def _infer_ports(
     if compose_ports:
         return compose_ports
     if has_frontend:
-        ports["frontend"] = 23000
+        ports["frontend"] = _DEFAULT_FRONTEND_PORT
     if has_backend:
-        ports["backend"] = 23001
+        ports["backend"] = _DEFAULT_BACKEND_PORT
     return ports
 
 
 def _ports_from_compose(target_repo: Path) -> dict[str, int]:
-    for name in ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"):
+    for name in _COMPOSE_FILE_NAMES:
         path = target_repo / name
         if not path.exists():
             continue
         text = path.read_text(encoding="utf-8", errors="ignore")
-        matches = re.findall(r"['\"]?(\d{2,5}):(\d{2,5})['\"]?", text)
+        matches = _COMPOSE_PORT_RE.findall(text)
         if matches:
             return {
                 f"port_{index}": int(host)
@@ -345,8 +351,11 @@ def _python_deps(pyproject_data: dict[str, Any]) -> set[str]:
     return {dep for dep in deps if dep}
 
 
+_DEPENDENCY_SPEC_RE = re.compile(r"[<>=~!;\[]")
+
+
 def _dependency_name(value: str) -> str:
-    return re.split(r"[<>=~!;\[]", str(value).lower(), maxsplit=1)[0].strip()
+    return _DEPENDENCY_SPEC_RE.split(str(value).lower(), maxsplit=1)[0].strip()
 
 
 def _npm_test_command(
@@ -405,6 +414,9 @@ def _dedupe(values: Iterable[str]) -> list[str]:
     return result
 
 
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slug(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _SLUG_SEP_RE.sub("-", value.lower()).strip("-")
     return slug[:64].strip("-") or "issue"
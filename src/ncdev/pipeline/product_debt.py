@@ -323,6 +323,9 @@ def _confidence(
     return 0.5
 
 
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _SLUG_SEP_RE.sub("-", value.lower()).strip("-")
     return slug[:48].strip("-") or "issue"
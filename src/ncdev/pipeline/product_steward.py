@@ -30,6 +30,7 @@ from ncdev.pipeline.models import (
 )
 from ncdev.pipeline.product_debt import DebtType, ProductDebt
 from ncdev.pipeline.provenance import load_provenance
+from ncdev.utils import loads_last_json_object, read_text_cached
 
 
 class Disposition(str, Enum):
@@ -63,25 +64,33 @@ _FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
 
 
 def parse_steward_response(text: str) -> StewardDecision:
-    """Parse the Steward's JSON response. Tolerates markdown fences."""
+    """Parse the Steward's JSON response.
+
+    Tolerates markdown fences and prose around the object; when several
+    objects appear, the last one is the decision.
+    """
     cleaned = _FENCE_RE.sub("", text.strip()).strip()
-    data = json.loads(cleaned)
+    data = loads_last_json_object(cleaned)
     return StewardDecision.model_validate(data)
 
 
 def _summarise_completed(completed: list[StepResult]) -> str:
     if not completed:
         return "(no features executed yet)"
-    lines = []
-    for r in completed:
-        files = len(r.files_created) + len(r.files_modified)
-        status = getattr(r.status, "name", str(r.status).upper())
-        lines.append(
-            f"  - {r.feature_id}: {status} "
-            f"({files} files, commit {r.commit_sha[:8] or '(none)'})"
-            + (f" - {r.error_message[:120]}" if r.error_message else "")
-        )
-    return "\n".join(lines)
+    return "\n".join(
+        f"  - {r.feature_id}: {_status_name(r.status)} "
+        f"({len(r.files_created) + len(r.files_modified)} files, "
+        f"commit {r.commit_sha[:8] or '(none)'})"
+        + (f" - {r.error_message[:120]}" if r.error_message else "")
+        for r in completed
+    )
+
+
+def _status_name(status: object) -> str:
+    # getattr's default would build str(status).upper() for every row,
+    # even though StepStatus members always carry .name.
+    name = getattr(status, "name", None)
+    return name if name is not None else str(status).upper()
 
 
 def _contract_stack(bundle: CharterBundle) -> str:
@@ -99,19 +108,17 @@ def _contract_stack(bundle: CharterBundle) -> str:
 def _summarise_product_debt(product_debt: list[ProductDebt] | None) -> str:
     if not product_debt:
         return ""
-    lines = ["### Detected product debt", ""]
-    for debt in product_debt:
-        routes = (
+    return "### Detected product debt\n\n" + "\n".join(
+        f"  - [{debt.debt_type.value}] {debt.debt_id} "
+        f"(confidence {debt.confidence:.1f}): {debt.description} "
+        f"Suggested: {debt.suggested_disposition.value}."
+        + (
             f" Affected routes: {', '.join(debt.affected_routes)}."
             if debt.affected_routes
             else ""
         )
-        lines.append(
-            f"  - [{debt.debt_type.value}] {debt.debt_id} "
-            f"(confidence {debt.confidence:.1f}): {debt.description} "
-            f"Suggested: {debt.suggested_disposition.value}.{routes}"
-        )
-    return "\n".join(lines)
+        for debt in product_debt
+    )
 
 
 def _summarise_feature_provenance(
@@ -127,8 +134,7 @@ def _summarise_feature_provenance(
     for feature_id in sorted(feature_provenance):
         files = sorted(feature_provenance[feature_id])
         lines.append(f"  - {feature_id}:")
-        for path in files[:20]:
-            lines.append(f"    - {path}")
+        lines.extend(map("    - {}".format, files[:20]))
         remaining = len(files) - 20
         if remaining > 0:
             lines.append(f"    - ... {remaining} more")
@@ -164,17 +170,20 @@ def _summarise_performance_status(
         ])
     if perf_debts:
         lines.append("Observed violations:")
-        for debt in perf_debts:
-            evidence = ", ".join(debt.evidence) if debt.evidence else "(no metrics)"
-            routes = (
-                f" Routes: {', '.join(debt.affected_routes)}."
-                if debt.affected_routes
-                else ""
-            )
-            lines.append(f"  - {debt.debt_id}: {debt.title}.{routes} Evidence: {evidence}")
+        lines.extend(map(_perf_violation_row, perf_debts))
     return "\n".join(lines)
 
 
+def _perf_violation_row(debt: ProductDebt) -> str:
+    evidence = ", ".join(debt.evidence) if debt.evidence else "(no metrics)"
+    routes = (
+        f" Routes: {', '.join(debt.affected_routes)}."
+        if debt.affected_routes
+        else ""
+    )
+    return f"  - {debt.debt_id}: {debt.title}.{routes} Evidence: {evidence}"
+
+
 def build_steward_prompt(
     *,
     prd_path: Path,
@@ -185,7 +194,8 @@ def build_steward_prompt(
     product_debt: list[ProductDebt] | None = None,
     feature_provenance: dict[str, list[str]] | None = None,
 ) -> str:
-    prd_excerpt = prd_path.read_text(encoding="utf-8")[:8000]
+    # Same PRD every factory cycle; served from cache until it changes.
+    prd_excerpt = read_text_cached(prd_path)[:8000]
     queue_summary = "\n".join(
         f"  - {f.feature_id}: {f.title}"
         for f in bundle.feature_queue.features
@@ -14,10 +14,17 @@ _FILENAME = "provenance.jsonl"
 
 
 def append_provenance(run_dir: Path, record: ProvenanceRecord) -> None:
-    run_dir.mkdir(parents=True, exist_ok=True)
     path = run_dir / _FILENAME
-    with path.open("a", encoding="utf-8") as f:
-        f.write(record.model_dump_json() + "\n")
+    line = record.model_dump_json() + "\n"
+    # Appended once per feature into an existing run dir; only a first
+    # write into a fresh one needs the mkdir.
+    try:
+        f = path.open("a", encoding="utf-8")
+    except FileNotFoundError:
+        run_dir.mkdir(parents=True, exist_ok=True)
+        f = path.open("a", encoding="utf-8")
+    with f:
+        f.write(line)
 
 
 def load_provenance(run_dir: Path) -> list[ProvenanceRecord]:
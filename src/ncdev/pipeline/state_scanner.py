@@ -29,18 +29,15 @@ regression.
 """
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-from rich.console import Console
-
 from ncdev.pipeline.models import FeatureStep, StepResult, StepStatus
 
-console = Console()
-
 
 def scan_completed_features(
     target_path: Path,
@@ -55,6 +52,13 @@ def scan_completed_features(
         return []
 
     git_log = _get_git_log(target_path)
+    # Features often share a required test file (one API suite backing
+    # several endpoints). The tree doesn't change during a scan, so each
+    # distinct runner invocation only needs to run once.
+    test_results: dict[tuple[str, ...], bool] = {}
+    # Required files cluster in a few directories (tests/, src/api/...),
+    # so one listing per directory answers every existence check.
+    listings: dict[str, frozenset[str]] = {}
 
     completed: list[str] = []
     for feature in feature_queue:
@@ -62,9 +66,11 @@ def scan_completed_features(
             continue
         if not _feat_commit_names_feature(feature, git_log):
             continue
-        if not _required_files_present(feature, target_path):
+        if not _required_files_present(feature, target_path, listings=listings):
             continue
-        ok, mention_violations = _required_tests_pass(feature, target_path)
+        ok, mention_violations = _required_tests_pass(
+            feature, target_path, results=test_results, listings=listings,
+        )
         if not ok or mention_violations:
             continue
         completed.append(feature.feature_id)
@@ -124,14 +130,51 @@ def _feat_commit_names_feature(feature: FeatureStep, git_log: str) -> bool:
     return re.search(pattern, git_log) is not None
 
 
-def _required_files_present(feature: FeatureStep, target_path: Path) -> bool:
+def _path_exists(
+    target_path: Path,
+    rel: str,
+    listings: dict[str, frozenset[str]] | None = None,
+) -> bool:
+    """``(target_path / rel).exists()``, answered from a cached listing.
+
+    With ``listings`` shared across calls, each parent directory is read
+    once with os.scandir instead of stat()ing every file. Names compare
+    exactly, so on a case-insensitive filesystem a wrongly-cased entry
+    reads as missing — the strict answer this scanner wants anyway.
+    """
+    if listings is None:
+        return (target_path / rel).exists()
+    parent, _, name = os.path.join(str(target_path), rel).rpartition(os.sep)
+    if name in ("", ".", ".."):
+        return (target_path / rel).exists()
+    names = listings.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent or os.sep) as entries:
+                # exists() follows symlinks; a dangling one is missing.
+                names = frozenset(
+                    e.name for e in entries
+                    if not e.is_symlink() or os.path.exists(e.path)
+                )
+        except OSError:
+            names = frozenset()
+        listings[parent] = names
+    return name in names
+
+
+def _required_files_present(
+    feature: FeatureStep,
+    target_path: Path,
+    *,
+    listings: dict[str, frozenset[str]] | None = None,
+) -> bool:
     """Every required_file must exist; with must_mention_feature_id, must
     also reference the feature_id."""
     accept = feature.acceptance
     for rel in accept.required_files:
-        fp = target_path / rel
-        if not fp.exists():
+        if not _path_exists(target_path, rel, listings):
             return False
+        fp = target_path / rel
         if accept.must_mention_feature_id and not _file_mentions(fp, feature.feature_id):
             return False
     return True
@@ -140,6 +183,9 @@ def _required_files_present(feature: FeatureStep, target_path: Path) -> bool:
 def _required_tests_pass(
     feature: FeatureStep,
     target_path: Path,
+    *,
+    results: dict[tuple[str, ...], bool] | None = None,
+    listings: dict[str, frozenset[str]] | None = None,
 ) -> tuple[bool, bool]:
     """Run each required_test. Return (all_passed, had_mention_violation).
 
@@ -154,18 +200,23 @@ def _required_tests_pass(
 
     mention_violation = False
     for rel in accept.required_tests:
-        tp = target_path / rel
-        if not tp.exists():
+        if not _path_exists(target_path, rel, listings):
             return False, mention_violation
+        tp = target_path / rel
         if accept.must_mention_feature_id and not _file_mentions(tp, feature.feature_id):
             mention_violation = True
             continue
-        if not _run_single_test(tp, target_path):
+        if not _run_single_test(tp, target_path, results=results):
             return False, mention_violation
     return True, mention_violation
 
 
-def _run_single_test(test_path: Path, cwd: Path) -> bool:
+def _run_single_test(
+    test_path: Path,
+    cwd: Path,
+    *,
+    results: dict[tuple[str, ...], bool] | None = None,
+) -> bool:
     """Run a single test file. True iff it exits 0 and reports passes.
 
     Resolves the right working directory for the test runner: backend
@@ -174,23 +225,35 @@ def _run_single_test(test_path: Path, cwd: Path) -> bool:
     a frontend test invoked from target_path fails to find
     node_modules / vite config and reports "1/3 failed" even when the
     test passes when invoked from frontend/.
+
+    ``results`` memoises outcomes by (project root, command) for callers
+    that run many tests against an unchanging tree.
     """
     project_root, runner_cmd = _runner_for_test(test_path, cwd)
     if runner_cmd is None or project_root is None:
         return False
 
+    key = (str(project_root), *runner_cmd)
+    if results is not None and key in results:
+        return results[key]
+
     try:
+        # Only the exit code matters here; a verbose suite's output is
+        # discarded at the pipe instead of buffered and decoded in full.
         result = subprocess.run(
             runner_cmd,
             cwd=str(project_root),
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=300,
         )
+        passed = result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        passed = False
 
-    return result.returncode == 0
+    if results is not None:
+        results[key] = passed
+    return passed
 
 
 def _runner_for_test(test_path: Path, target_path: Path) -> tuple[Path | None, list[str] | None]:
@@ -222,10 +285,13 @@ def _runner_for_test(test_path: Path, target_path: Path) -> tuple[Path | None, l
         cmd_template = [_default_python_runner(), "-m", "pytest", "-q", "-x"]
     elif suffix in {".ts", ".tsx", ".js", ".jsx"}:
         marker_name = "package.json"
+        # Callers only need pass/fail, so every runner stops at the first
+        # failing test (pytest -x, vitest --bail=1, playwright -x) rather
+        # than finishing a suite whose verdict is already decided.
         if _looks_like_playwright_test(test_path):
-            cmd_template = ["npx", "playwright", "test"]
+            cmd_template = ["npx", "playwright", "test", "-x"]
         else:
-            cmd_template = ["npx", "vitest", "run"]
+            cmd_template = ["npx", "vitest", "run", "--bail=1"]
     else:
         return None, None
 
@@ -5,6 +5,8 @@ import re
 import shutil
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, pairwise
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +15,9 @@ def _utc_stamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
+# Keyed by project name: every intake, lookup and status call for a
+# project re-derives the same directory slug through a per-char loop.
+@lru_cache(maxsize=256)
 def _slug(text: str) -> str:
     cleaned = "".join(ch.lower() if ch.isalnum() else "-" for ch in text).strip("-")
     return "-".join(part for part in cleaned.split("-") if part)[:80] or "project"
@@ -59,6 +64,8 @@ class TestCraftrReport:
 
 _TEST_CRAFTR_SECTION_RE = re.compile(r"^## Issue #(?P<num>\d+): (?P<title>.+)$", re.MULTILINE)
 _TEST_CRAFTR_FIELD_ROW_RE = re.compile(r"^\| \*\*(?P<key>[^*]+)\*\* \| (?P<value>.*?) \|$", re.MULTILINE)
+_SUMMARY_SECTION_RE = re.compile(r"## Summary\s+(?P<body>.*?)(?:\n---|\n## |\Z)", re.DOTALL)
+_NUMBERED_ITEM_RE = re.compile(r"^\d+\.\s+")
 
 
 def import_manual_qa_report(
@@ -236,12 +243,13 @@ def parse_test_craftr_markdown(markdown: str, *, source_path: Path | None = None
     status = _metadata(markdown, "Status")
     summary = _parse_summary(markdown)
 
-    matches = list(_TEST_CRAFTR_SECTION_RE.finditer(markdown))
     issues: list[TestCraftrIssue] = []
-    for idx, match in enumerate(matches):
-        start = match.end()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(markdown)
-        block = markdown[start:end]
+    # Each section runs to the next heading, so walk (heading, next
+    # heading) pairs straight off finditer rather than listing them all.
+    sections = chain(_TEST_CRAFTR_SECTION_RE.finditer(markdown), (None,))
+    for match, following in pairwise(sections):
+        end = following.start() if following is not None else len(markdown)
+        block = markdown[match.end():end]
         fields = {
             m.group("key").strip().lower(): m.group("value").strip()
             for m in _TEST_CRAFTR_FIELD_ROW_RE.finditer(block)
@@ -318,14 +326,28 @@ def _json_issue_context(issue: dict) -> dict:
     return context if isinstance(context, dict) else {}
 
 
+# Labels and headings come from a small fixed set, but are looked up
+# once per issue block — compile each pattern once, not per call.
+@lru_cache(maxsize=64)
+def _metadata_re(label: str) -> re.Pattern[str]:
+    return re.compile(rf"^\*\*{re.escape(label)}\*\*: ?(.+)$", re.MULTILINE)
+
+
+@lru_cache(maxsize=64)
+def _section_re(heading: str) -> re.Pattern[str]:
+    return re.compile(
+        rf"^### {re.escape(heading)}\s*(?P<body>.*?)(?=^### |^---\s*$|^## |\Z)",
+        re.DOTALL | re.MULTILINE,
+    )
+
+
 def _metadata(markdown: str, label: str) -> str:
-    pattern = re.compile(rf"^\*\*{re.escape(label)}\*\*: ?(.+)$", re.MULTILINE)
-    match = pattern.search(markdown)
+    match = _metadata_re(label).search(markdown)
     return match.group(1).strip() if match else ""
 
 
 def _parse_summary(markdown: str) -> dict[str, str]:
-    summary_match = re.search(r"## Summary\s+(?P<body>.*?)(?:\n---|\n## |\Z)", markdown, re.DOTALL)
+    summary_match = _SUMMARY_SECTION_RE.search(markdown)
     if not summary_match:
         return {}
     summary: dict[str, str] = {}
@@ -339,11 +361,7 @@ def _parse_summary(markdown: str) -> dict[str, str]:
 
 
 def _section_text(block: str, heading: str) -> str:
-    match = re.search(
-        rf"^### {re.escape(heading)}\s*(?P<body>.*?)(?=^### |^---\s*$|^## |\Z)",
-        block,
-        re.DOTALL | re.MULTILINE,
-    )
+    match = _section_re(heading).search(block)
     if not match:
         return ""
     return _strip_code_fence(match.group("body").strip())
@@ -358,7 +376,7 @@ def _section_numbered_list(block: str, heading: str) -> list[str]:
     text = _section_text(block, heading)
     items: list[str] = []
     for line in text.splitlines():
-        item = re.sub(r"^\d+\.\s+", "", line).strip()
+        item = _NUMBERED_ITEM_RE.sub("", line).strip()
         if item and item != line:
             items.append(item)
     return items
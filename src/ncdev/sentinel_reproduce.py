@@ -7,6 +7,7 @@ the whole fix is halted with CANNOT_REPRODUCE.
 """
 from __future__ import annotations
 
+import re
 import subprocess
 import sys
 from dataclasses import dataclass
@@ -21,8 +22,29 @@ from ncdev.core.sentinel_prompts import build_reproduction_prompt
 _MAX_FILE_CHARS = 16_000
 _TEST_TIMEOUT_SECONDS = 300
 
+# Test output that means the runner itself broke, not that the test
+# reproduced the bug. One case-insensitive pass over the output instead
+# of lowering a copy (test logs run to MBs) and scanning it per marker.
+_UNRELATED_TEST_ERROR_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "no supported test runner",
+            "test runner not found",
+            "test timed out",
+            "no tests ran",
+            "collected 0 items",
+            "modulenotfounderror",
+            "importerror",
+            "syntaxerror",
+            "configuration error",
+        )
+    ),
+    re.IGNORECASE,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class ReproductionResult:
     reproduced: bool
     test_path: str = ""          # repo-relative path to the test the session wrote
@@ -233,19 +255,16 @@ def _git_changed_files(repo_dir: Path) -> set[str]:
         return set()
 
     files: set[str] = set()
-    entries = [entry for entry in result.stdout.split("\0") if entry]
-    skip_next = False
+    # A rename/copy record is followed by its source path as a separate
+    # NUL-terminated field; consume it off the same iterator.
+    entries = iter(result.stdout.split("\0"))
     for entry in entries:
-        if skip_next:
-            skip_next = False
-            continue
-        status = entry[:2]
-        path = entry[3:]
+        status, path = entry[:2], entry[3:]
         if not path:
             continue
         files.add(path)
         if "R" in status or "C" in status:
-            skip_next = True
+            next(entries, None)
     return files
 
 
@@ -265,8 +284,8 @@ def _local_runner_for_test(test_path: Path, repo_dir: Path) -> tuple[Path | None
     if suffix in {".ts", ".tsx", ".js", ".jsx"}:
         rel = str(test_path.relative_to(repo_dir))
         if _looks_like_playwright_path(test_path):
-            return repo_dir, ["npx", "playwright", "test", rel]
-        return repo_dir, ["npx", "vitest", "run", rel]
+            return repo_dir, ["npx", "playwright", "test", "-x", rel]
+        return repo_dir, ["npx", "vitest", "run", "--bail=1", rel]
     return None, None
 
 
@@ -322,16 +341,4 @@ def _combined_output(stdout: str, stderr: str) -> str:
 
 
 def _looks_like_unrelated_test_error(output: str) -> bool:
-    lower = output.lower()
-    unrelated_markers = (
-        "no supported test runner",
-        "test runner not found",
-        "test timed out",
-        "no tests ran",
-        "collected 0 items",
-        "modulenotfounderror",
-        "importerror",
-        "syntaxerror",
-        "configuration error",
-    )
-    return any(marker in lower for marker in unrelated_markers)
+    return _UNRELATED_TEST_ERROR_RE.search(output) is not None
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import subprocess
+import threading
+import time
 import uuid
+from collections import deque
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +32,63 @@ def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def read_text_cached(path: Path) -> str:
+    """``read_text`` for files re-read across retries and cycles.
+
+    Keyed by (path, mtime_ns, size), so an edit to the file invalidates
+    the entry without any explicit flush.
+    """
+    st = path.stat()
+    return _read_text_keyed(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _read_text_keyed(path: str, mtime_ns: int, size: int) -> str:  # noqa: ARG001
+    return Path(path).read_text(encoding="utf-8")
+
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _looks_like_sha(value: str) -> bool:
+    return len(value) in (40, 64) and _HEX_DIGITS.issuperset(value)
+
+
+def read_git_head(repo: Path) -> str | None:
+    """HEAD's commit sha read straight from ``repo/.git``, or None.
+
+    Answers the common ``git rev-parse HEAD`` case — a plain .git
+    directory with a detached HEAD, a loose branch ref, or a packed one —
+    without spawning git. Anything else (a .git file from a linked
+    worktree or submodule, GIT_DIR overrides, reftable storage, symbolic
+    chains, an unborn branch) returns None, and the caller asks git.
+    """
+    if os.environ.get("GIT_DIR") or os.environ.get("GIT_WORK_TREE"):
+        return None
+    git_dir = repo / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:   # no .git dir, or .git is a file
+        return None
+    if not head.startswith("ref: "):
+        return head if _looks_like_sha(head) else None
+    ref = head[5:].strip()
+    try:
+        sha = (git_dir / ref).read_text(encoding="utf-8").strip()
+        return sha if _looks_like_sha(sha) else None
+    except OSError:
+        pass
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha if _looks_like_sha(sha) else None
+    return None
+
+
 def write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2, sort_keys=False), encoding="utf-8")
@@ -34,3 +97,149 @@ def write_json(path: Path, payload: Any) -> None:
 def write_text(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(text, encoding="utf-8")
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def loads_last_json_object(text: str) -> Any:
+    """Return the last top-level JSON object embedded in ``text``.
+
+    Model replies often wrap the payload in prose or emit a draft object
+    before the final one; ``json.loads`` rejects both. Each candidate is
+    decoded in place with ``raw_decode`` and the scan resumes after it,
+    so a decoded object's interior is never re-parsed. Raises
+    ``json.JSONDecodeError`` when no object is found.
+    """
+    last: Any = None
+    found = False
+    pos = 0
+    while True:
+        start = text.find("{", pos)
+        if start < 0:
+            break
+        try:
+            last, pos = _JSON_DECODER.raw_decode(text, start)
+            found = True
+        except json.JSONDecodeError:
+            pos = start + 1
+    if not found:
+        raise json.JSONDecodeError("no JSON object found", text, 0)
+    return last
+
+
+class TailBuffer:
+    """Accumulate text but keep only the tail of ``max_bytes``.
+
+    Recent output is more useful than the head when debugging a builder
+    that went off the rails. ``truncated`` flips True once we start
+    dropping bytes so callers can surface that to users / logs.
+
+    If a single incoming chunk is larger than ``max_bytes``, we slice
+    the tail bytes out of *that* chunk instead of evicting it wholesale
+    (Codex R3 flagged: the previous behavior produced an empty buffer
+    when a single append overflowed the cap).
+    """
+
+    __slots__ = ("_chunks", "_size", "_max", "truncated")
+
+    def __init__(self, max_bytes: int) -> None:
+        # (chunk, encoded_size) pairs. A deque makes head eviction O(1)
+        # and carrying the size avoids re-encoding a chunk on its way
+        # out — a chatty run evicts on nearly every line once full.
+        self._chunks: deque[tuple[str, int]] = deque()
+        self._size = 0
+        self._max = max(max_bytes, 1)
+        self.truncated = False
+
+    def append(self, chunk: str) -> None:
+        if not chunk:
+            return
+
+        # Oversized single chunk: keep the tail bytes of this chunk only.
+        chunk_bytes = chunk.encode("utf-8", errors="ignore")
+        if len(chunk_bytes) > self._max:
+            tail_bytes = chunk_bytes[-self._max:]
+            tail = tail_bytes.decode("utf-8", errors="ignore")
+            tail_size = len(tail.encode("utf-8", errors="ignore"))
+            self._chunks.clear()
+            self._chunks.append((tail, tail_size))
+            self._size = tail_size
+            self.truncated = True
+            return
+
+        self._chunks.append((chunk, len(chunk_bytes)))
+        self._size += len(chunk_bytes)
+
+        # Normal eviction path: drop whole chunks from the head until
+        # we're under the cap again. Safe now because no single chunk
+        # is larger than ``_max``.
+        while self._size > self._max and len(self._chunks) > 1:
+            _, head_size = self._chunks.popleft()
+            self._size -= head_size
+            self.truncated = True
+
+    def text(self) -> str:
+        return "".join(chunk for chunk, _ in self._chunks)
+
+
+# Per-stream cap on captured test/build output. Callers only keep the
+# head 2000 chars or the last line; a verbose suite can print hundreds
+# of MB, which capture_output would hold in full until exit.
+_SHELL_CAPTURE_MAX_BYTES = 1024 * 1024
+
+
+def _drain_into(stream, buf: TailBuffer) -> None:
+    try:
+        for chunk in iter(lambda: stream.read(65536), ""):
+            buf.append(chunk)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def run_shell(
+    cmd: str,
+    *,
+    cwd: Path,
+    timeout: int,
+    max_bytes: int = _SHELL_CAPTURE_MAX_BYTES,
+) -> tuple[bool, str]:
+    """Run ``cmd`` in a shell. Returns (success, combined_output).
+
+    stdout and stderr are drained into tail-bounded buffers, so memory
+    stays at ``max_bytes`` per stream however chatty the command is.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd, shell=True, cwd=str(cwd),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            # Test output is not guaranteed UTF-8; a strict decode would
+            # kill the drain thread and leave the pipe to fill up.
+            encoding="utf-8", errors="replace",
+        )
+    except Exception as exc:  # noqa: BLE001
+        return False, f"exec error: {exc}"
+
+    stdout_buf = TailBuffer(max_bytes)
+    stderr_buf = TailBuffer(max_bytes)
+    drains = [
+        threading.Thread(target=_drain_into, args=(proc.stdout, stdout_buf), daemon=True),
+        threading.Thread(target=_drain_into, args=(proc.stderr, stderr_buf), daemon=True),
+    ]
+    for t in drains:
+        t.start()
+
+    deadline = time.monotonic() + timeout
+    try:
+        proc.wait(timeout=timeout)
+        # A backgrounded grandchild can keep the pipes open past the
+        # shell's exit; like communicate(), that counts against timeout.
+        for t in drains:
+            t.join(max(deadline - time.monotonic(), 0))
+        if any(t.is_alive() for t in drains):
+            raise subprocess.TimeoutExpired(cmd, timeout)
+    except subprocess.TimeoutExpired as exc:
+        proc.kill()
+        proc.wait()
+        return False, f"timed out after {timeout}s: {exc}"
+    return proc.returncode == 0, (stdout_buf.text() + "\n" + stderr_buf.text())
@@ -6,6 +6,7 @@ Provides reusable fixtures for:
 - Mocked Ollama and Codex responses
 - Pre-parsed features, architecture, and test plans
 - Mock subprocess helpers
+- A per-test reset of the capability probe cache
 """
 
 from __future__ import annotations
@@ -19,6 +20,21 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 
+# ---------------------------------------------------------------------------
+# Process-wide caches
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def _reset_capability_probe_cache():
+    """Many tests stub ``_run_version``/``_run_help``; a probe memoised by an
+    earlier test for an installed claude/codex would bypass those stubs."""
+    from ncdev.core.capability_probe import reset_cache
+
+    reset_cache()
+    yield
+    reset_cache()
+
+
 # ---------------------------------------------------------------------------
 # Paths & Directories
 # ---------------------------------------------------------------------------
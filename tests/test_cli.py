@@ -389,3 +389,97 @@ def test_cli_factory_from_issues_calls_from_issues_runner(monkeypatch, tmp_path)
     assert rc == 0
     assert captured["report_path"] == report.resolve()
     assert captured["target_repo_path"] == target.resolve()
+
+
+def _quality_gate_fix_manifest(monkeypatch, tmp_path, urls, *, query, provider) -> dict:
+    """Patch Citex and the AI provider for ``_run_quality_gate_fixes``.
+
+    Returns a manifest with one issue per entry in ``urls``; ``query``
+    stands in for ``CitexClient.query``.
+    """
+    import ncdev.ai_provider as ai_provider
+    import ncdev.pipeline.citex_client as citex_client
+    from ncdev import cli
+
+    class FakeCitex:
+        def __init__(self, project_id):
+            pass
+
+        def query(self, query_text, category=None, limit=5):
+            return query(query_text, category)
+
+    monkeypatch.setattr(cli, "require_citex", lambda: None)
+    monkeypatch.setattr(citex_client, "CitexClient", FakeCitex)
+    monkeypatch.setattr(ai_provider, "get_provider_with_fallback", lambda *a: provider)
+    monkeypatch.setattr(cli, "_checkpoint_working_tree", lambda target: "")
+
+    issues = [
+        {
+            "id": f"I{n}", "priority": "P1", "persona": "p", "category": "c",
+            "title": f"t{n}", "flow": f"{url} → click", "expected": "e",
+            "actual": "a", "root_cause_hint": "", "reproduction": [],
+        }
+        for n, url in enumerate(urls, start=1)
+    ]
+    return {"run_id": "r", "target_path": str(tmp_path), "scores": {}, "issues": issues}
+
+
+def test_quality_gate_fixes_prefetch_citex_per_url_group(monkeypatch, tmp_path):
+    import asyncio
+
+    from ncdev import cli
+
+    prompts: list[str] = []
+
+    class FakeProvider:
+        async def complete(self, *, prompt, **kwargs):
+            prompts.append(prompt)
+            return "done"
+
+    manifest = _quality_gate_fix_manifest(
+        monkeypatch, tmp_path, ["/a", "/b", "/a"],
+        query=lambda query, category: [f"{category}:{query}"],
+        provider=FakeProvider(),
+    )
+    monkeypatch.setattr(cli, "_check_app_boots", lambda target: True)
+    monkeypatch.setattr(cli, "_commit_fix", lambda target, msg: True)
+
+    assert asyncio.run(cli._run_quality_gate_fixes(manifest)) == 3
+    assert len(prompts) == 2
+    assert "signals:Test findings for /a" in prompts[0]
+    assert "code:Component handling /a" in prompts[0]
+    assert "signals:Test findings for /b" in prompts[1]
+    assert "/a" not in prompts[1].split("Citex RAG")[1]
+
+
+def test_quality_gate_fixes_settle_prefetched_lookups_when_fix_raises(monkeypatch, tmp_path):
+    import asyncio
+    import gc
+
+    from ncdev import cli
+
+    def query(query, category):
+        if "/b" in query:
+            raise RuntimeError("citex down")
+        return []
+
+    class FakeProvider:
+        async def complete(self, **kwargs):
+            await asyncio.sleep(0.2)   # let the /b prefetch fail first
+            raise RuntimeError("provider crashed")
+
+    manifest = _quality_gate_fix_manifest(
+        monkeypatch, tmp_path, ["/a", "/b"], query=query, provider=FakeProvider(),
+    )
+
+    unhandled: list[dict] = []
+
+    async def main() -> None:
+        asyncio.get_running_loop().set_exception_handler(lambda _loop, ctx: unhandled.append(ctx))
+        with pytest.raises(RuntimeError, match="provider crashed"):
+            await cli._run_quality_gate_fixes(manifest)
+        gc.collect()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert unhandled == []
@@ -142,3 +142,18 @@ def test_recent_lessons_respects_limit(monkeypatch, tmp_path):
 def test_recent_lessons_empty_ledger(monkeypatch, tmp_path):
     monkeypatch.setattr("ncdev.core.capability_ledger.Path.home", lambda: tmp_path)
     assert recent_lessons() == []
+
+
+def test_recent_lessons_stops_at_tail_and_skips_corrupt(monkeypatch, tmp_path):
+    monkeypatch.setattr("ncdev.core.capability_ledger.Path.home", lambda: tmp_path)
+    for i in range(10):
+        append_entry(_entry(run_id=f"r{i}", project_name="alpha" if i % 2 else "beta",
+                            capability_lessons=[f"lesson {i}"]))
+    # A corrupt head line must never be reached for a small limit, and
+    # a corrupt line inside the tail is skipped.
+    ledger_path().write_text(
+        "{bad head\n" + ledger_path().read_text(encoding="utf-8") + "{bad tail\n\n",
+        encoding="utf-8",
+    )
+    assert recent_lessons(project_name="alpha", limit=2) == ["lesson 7", "lesson 9"]
+    assert recent_lessons(limit=3) == ["lesson 7", "lesson 8", "lesson 9"]
@@ -117,6 +117,7 @@ def test_is_model_rejection_error_matches_known_phrases():
     assert is_model_rejection_error("you do not have access to this model")
     assert is_model_rejection_error(None, "invalid model: opus-9")
     assert not is_model_rejection_error("timed out after 600s")
+    assert is_model_rejection_error("ERROR: Unknown Model 'opus-x'")
     assert not is_model_rejection_error(None, None)
 
 
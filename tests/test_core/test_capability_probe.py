@@ -152,3 +152,60 @@ def test_persist_capability_snapshot_writes_to_workspace(tmp_path, monkeypatch):
     loaded = load_snapshot(path)
     assert loaded is not None
     assert loaded.schema_id == "capability-snapshot.1"
+
+
+def test_version_and_help_probes_run_concurrently(monkeypatch):
+    import threading
+
+    from ncdev.core.capability_probe import _run_version_and_help
+
+    # Each fake probe waits for the other to start; serial execution
+    # would time out the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake(kind):
+        def _probe(_binary):
+            barrier.wait()
+            return kind
+        return _probe
+
+    monkeypatch.setattr("ncdev.core.capability_probe._run_version", fake("1.0.0"))
+    monkeypatch.setattr("ncdev.core.capability_probe._run_help", fake("--help-text"))
+    assert _run_version_and_help("codex") == ("1.0.0", "--help-text")
+
+
+def test_version_and_help_cached_per_installed_binary(tmp_path, monkeypatch):
+    import os
+
+    from ncdev.core import capability_probe as cp
+
+    fake_bin = tmp_path / "codex"
+    fake_bin.write_text("#!/bin/sh\n", encoding="utf-8")
+    calls: list[str] = []
+    monkeypatch.setattr(cp.shutil, "which", lambda _b: str(fake_bin))
+    monkeypatch.setattr(cp, "_run_version", lambda _b: calls.append("v") or "1.0.0")
+    monkeypatch.setattr(cp, "_run_help", lambda _b: calls.append("h") or "--x")
+
+    assert cp._run_version_and_help("codex") == ("1.0.0", "--x")
+    assert cp._run_version_and_help("codex") == ("1.0.0", "--x")
+    assert sorted(calls) == ["h", "v"]
+
+    # Upgrading the binary (new mtime) invalidates the entry.
+    st = fake_bin.stat()
+    os.utime(fake_bin, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    cp._run_version_and_help("codex")
+    assert len(calls) == 4
+
+
+def test_half_failed_probe_is_not_cached(tmp_path, monkeypatch):
+    from ncdev.core import capability_probe as cp
+
+    fake_bin = tmp_path / "codex"
+    fake_bin.write_text("#!/bin/sh\n", encoding="utf-8")
+    help_text = iter(["", "--x"])
+    monkeypatch.setattr(cp.shutil, "which", lambda _b: str(fake_bin))
+    monkeypatch.setattr(cp, "_run_version", lambda _b: "1.0.0")
+    monkeypatch.setattr(cp, "_run_help", lambda _b: next(help_text))
+
+    assert cp._run_version_and_help("codex") == ("1.0.0", "")
+    assert cp._run_version_and_help("codex") == ("1.0.0", "--x")
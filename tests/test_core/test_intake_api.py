@@ -122,3 +122,42 @@ def test_no_auth_when_no_key(tmp_path: Path) -> None:
     raw = json.loads((FIXTURES_DIR / "backend_error.json").read_text())
     resp = client.post("/api/v1/reports", json=raw)
     assert resp.status_code == 202
+
+
+def test_shutdown_cancels_queued_runs(tmp_path: Path) -> None:
+    import threading
+
+    (tmp_path / ".nc-dev").mkdir()
+    (tmp_path / ".nc-dev" / "config.yaml").write_text(
+        "sentinel:\n  intake:\n    max_concurrent_runs: 1\n", encoding="utf-8",
+    )
+    release = threading.Event()
+    first_started = threading.Event()
+    started: list[str] = []
+
+    def blocking_runner(**kw):
+        started.append(kw["run_id"])
+        first_started.set()
+        release.wait(timeout=10)
+        raise RuntimeError("stop")
+
+    app = create_app(workspace=tmp_path, fix_runner=blocking_runner)
+    raw = json.loads((FIXTURES_DIR / "backend_error.json").read_text())
+    run_ids = []
+    with TestClient(app) as c:
+        for i in range(5):
+            body = dict(raw, report_id=f"{raw['report_id']}-{i}")
+            run_ids.append(c.post("/api/v1/reports", json=body).json()["run_id"])
+            if i == 0:
+                assert first_started.wait(timeout=10)
+    release.set()
+
+    # The single worker holds the first run; the four behind it are
+    # cancelled at shutdown rather than built afterwards, and the run
+    # already in flight is never reported as cancelled.
+    statuses = [TestClient(app).get(f"/api/v1/runs/{rid}").json() for rid in run_ids]
+    assert started == run_ids[:1]
+    assert "cancelled" not in (statuses[0]["error"] or "")
+    for status in statuses[1:]:
+        assert status["status"] == "failed"
+        assert status["error"].startswith("cancelled:")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
+from ncdev.claude_session import CLI_MISSING_ERROR
 from ncdev.pipeline.engine import run_pipeline
 from ncdev.pipeline.models import (
     CharterBundle,
@@ -254,3 +255,50 @@ def test_detect_verification_regressions_helper_ignores_blocked_with_failed_dep(
         ),
     ]
     assert _detect_verification_regressions(completed) == []
+
+
+def test_missing_session_cli_halts_even_when_continuing(tmp_path: Path, monkeypatch):
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    source = workspace / "prd.md"
+    source.write_text("# PRD")
+    target = workspace / "target"
+    target.mkdir()
+
+    bundle = _two_feature_bundle()
+    bundle.feature_queue.features[1].depends_on_features = []
+
+    monkeypatch.setattr(
+        "ncdev.pipeline.engine.generate_charter",
+        lambda **kwargs: (bundle, SimpleNamespace(summary=lambda: "ok")),
+    )
+    monkeypatch.setattr(
+        "ncdev.pipeline.engine.run_design_phase",
+        lambda **kwargs: SimpleNamespace(skipped=True, hard_failed=False, design_doc=None),
+    )
+    monkeypatch.setattr(
+        "ncdev.pipeline.state_scanner.scan_completed_features",
+        lambda target_path, features: [],
+    )
+
+    call_log: list[str] = []
+
+    def fake_executor(*, feature, **kwargs):  # noqa: ARG001
+        call_log.append(feature.feature_id)
+        return StepResult(
+            feature_id=feature.feature_id,
+            status=StepStatus.FAILED,
+            error_message=f"claude {CLI_MISSING_ERROR}",
+        )
+
+    monkeypatch.setattr("ncdev.pipeline.engine.execute_feature_claude_driven", fake_executor)
+
+    run_pipeline(
+        workspace=workspace,
+        source_path=source,
+        target_repo_path=target,
+        halt_on_failed=False,
+        skip_integration_gate=True,
+    )
+
+    assert call_log == ["f1"]
@@ -134,6 +134,21 @@ def test_must_mention_off_skips_content_check(tmp_path: Path) -> None:
     assert _required_files_present(feature, tmp_path) is True
 
 
+def test_required_files_shared_listing_matches_exists(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "x.py").write_text("x = 1\n")
+    (tmp_path / "src" / "dangling.py").symlink_to(tmp_path / "gone.py")
+    listings: dict[str, frozenset[str]] = {}
+    present = _feat("f01", required_files=["src/x.py", "src"], must_mention_feature_id=False)
+    dangling = _feat("f02", required_files=["src/dangling.py"], must_mention_feature_id=False)
+    missing = _feat("f03", required_files=["lib/y.py"], must_mention_feature_id=False)
+    assert _required_files_present(present, tmp_path, listings=listings) is True
+    assert _required_files_present(dangling, tmp_path, listings=listings) is False
+    assert _required_files_present(missing, tmp_path, listings=listings) is False
+    # One listing per parent directory, reused across features.
+    assert set(listings) == {str(tmp_path), str(tmp_path / "src"), str(tmp_path / "lib")}
+
+
 # ---------------------------------------------------------------------------
 # scan_completed_features — full pipeline
 # ---------------------------------------------------------------------------
@@ -224,6 +239,35 @@ def test_scan_does_not_skip_when_test_does_not_mention_feature_id(tmp_path: Path
     assert scan_completed_features(tmp_path, features) == []
 
 
+def test_scan_runs_shared_required_test_once(tmp_path: Path, monkeypatch) -> None:
+    _git_repo(tmp_path)
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_api.py").write_text(
+        "# f01-auth f02-profile\ndef test_works():\n    assert True\n"
+    )
+    _commit(tmp_path, "feat(f01-auth): api")
+    _commit(tmp_path, "feat(f02-profile): api")
+
+    import ncdev.pipeline.state_scanner as scanner
+
+    runs: list[list[str]] = []
+    real_run = scanner.subprocess.run
+
+    def counting_run(cmd, *args, **kwargs):
+        if cmd and cmd[0] != "git":
+            runs.append(list(cmd))
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(scanner.subprocess, "run", counting_run)
+    features = [
+        _feat("f01-auth", required_tests=["tests/test_api.py"]),
+        _feat("f02-profile", required_tests=["tests/test_api.py"]),
+    ]
+    assert scan_completed_features(tmp_path, features) == ["f01-auth", "f02-profile"]
+    assert len(runs) == 1
+
+
 # ---------------------------------------------------------------------------
 # _file_mentions helper
 # ---------------------------------------------------------------------------
@@ -291,7 +335,7 @@ def test_runner_for_test_frontend_finds_package_json(tmp_path: Path) -> None:
 
     project_root, cmd = _runner_for_test(test_file, tmp_path)
     assert project_root == tmp_path / "frontend"
-    assert cmd == ["npx", "vitest", "run", "src/__tests__/smoke.test.tsx"]
+    assert cmd == ["npx", "vitest", "run", "--bail=1", "src/__tests__/smoke.test.tsx"]
 
 
 def test_runner_for_test_falls_back_when_no_marker(tmp_path: Path) -> None:
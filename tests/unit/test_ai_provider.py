@@ -147,3 +147,46 @@ class TestGetProviderWithFallback:
         with patch.object(CodexCLIProvider, "is_available", return_value=False):
             with pytest.raises(ValueError):
                 get_provider_with_fallback("codex", "gpt4")
+
+
+# ------------------------------------------------------------------
+# _call_sync timeout path
+# ------------------------------------------------------------------
+
+
+class TestCallSyncTimeout:
+    def test_timeout_kills_child_and_keeps_partial_stderr(self, caplog):
+        import sys
+        import time
+
+        provider = CodexCLIProvider()
+        script = "import sys, time; sys.stderr.write('booting model\\n'); sys.stderr.flush(); time.sleep(60)"
+        with patch.object(
+            CodexCLIProvider, "_build_shell_cmd",
+            return_value=f'"{sys.executable}" -c "{script}"',
+        ):
+            start = time.time()
+            with caplog.at_level("ERROR", logger="ncdev.ai_provider"):
+                assert provider._call_sync("x", timeout=1) is None
+        assert time.time() - start < 15
+        assert "booting model" in caplog.text
+
+
+class TestCompleteBackstop:
+    def test_outer_deadline_returns_none(self, caplog):
+        import asyncio
+        import time
+
+        provider = CodexCLIProvider()
+
+        def _slow(*_args):
+            time.sleep(0.5)
+            return "late"
+
+        with patch.object(CodexCLIProvider, "is_available", return_value=True), \
+                patch.object(CodexCLIProvider, "_call_sync", side_effect=_slow):
+            with caplog.at_level("ERROR", logger="ncdev.ai_provider"):
+                # timeout + 10 == 0.1s backstop, shorter than the sync call.
+                result = asyncio.run(provider.complete("x", timeout=-9.9))
+        assert result is None
+        assert "timed out" in caplog.text
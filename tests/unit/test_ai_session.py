@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 import time
 from pathlib import Path
 from unittest.mock import patch
@@ -273,6 +276,21 @@ def test_run_codex_session_errors_when_cli_missing(tmp_path: Path):
     assert "codex CLI not found" in (result.error or "")
 
 
+class _FakeStdin:
+    """Captures what the runner pipes to the child's stdin."""
+
+    def __init__(self):
+        self.written = ""
+        self.closed = False
+
+    def write(self, text: str) -> int:
+        self.written += text
+        return len(text)
+
+    def close(self) -> None:
+        self.closed = True
+
+
 class _FakeCodexProc:
     """Minimal Popen stand-in: stdout + stderr iterable, immediate exit."""
 
@@ -281,6 +299,7 @@ class _FakeCodexProc:
     def __init__(self, stdout: str = "codex output\n", stderr: str = "", returncode: int = 0):
         _FakeCodexProc._next_pid += 1
         self.pid = _FakeCodexProc._next_pid
+        self.stdin = _FakeStdin()
         self.stdout = iter([stdout] if stdout else [])
         self.stderr = iter([stderr] if stderr else [])
         self.returncode = returncode
@@ -304,7 +323,8 @@ def test_run_codex_session_builds_correct_argv(tmp_path: Path):
     def fake_popen(cmd, **kwargs):
         captured["cmd"] = cmd
         captured["kwargs"] = kwargs
-        return _FakeCodexProc(stdout="codex output\n")
+        captured["proc"] = _FakeCodexProc(stdout="codex output\n")
+        return captured["proc"]
 
     with patch("ncdev.ai_session.shutil.which", return_value="/usr/bin/codex"):
         with patch("ncdev.ai_session.subprocess.Popen", side_effect=fake_popen):
@@ -316,13 +336,36 @@ def test_run_codex_session_builds_correct_argv(tmp_path: Path):
     assert "--full-auto" in cmd
     assert "--sandbox" in cmd
     assert "danger-full-access" in cmd
-    # Prompt is last arg
-    assert "build feature X" in cmd[-1]
-    assert "codex_only mode" in cmd[-1]
+    # Prompt is piped on stdin; "-" tells codex to read it from there
+    assert cmd[-1] == "-"
+    assert captured["kwargs"]["stdin"] is subprocess.PIPE
+    stdin = captured["proc"].stdin
+    assert "build feature X" in stdin.written
+    assert "codex_only mode" in stdin.written
+    assert stdin.closed is True
     assert result.success is True
     assert "codex output" in result.final_text
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell script stands in for codex")
+def test_run_codex_session_timeout_covers_unread_prompt(tmp_path: Path, monkeypatch):
+    """A child that never reads stdin must not block the timeout behind
+    a prompt larger than the pipe buffer."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake = bin_dir / "codex"
+    fake.write_text("#!/bin/sh\nsleep 30\n", encoding="utf-8")
+    fake.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+
+    start = time.monotonic()
+    result = run_codex_session("x" * 200_000, cwd=tmp_path, timeout=1)
+
+    assert time.monotonic() - start < 15
+    assert result.success is False
+    assert "timed out after 1s" in (result.error or "")
+
+
 def test_run_codex_session_writes_log(tmp_path: Path):
     def fake_popen(cmd, **kwargs):  # noqa: ARG001
         return _FakeCodexProc(stdout="the work\n", stderr="")
@@ -362,11 +405,11 @@ def test_run_codex_session_truncates_huge_stream(tmp_path: Path):
 
 
 def test_tail_buffer_preserves_tail_of_oversized_chunk():
-    """Codex R3 flagged: _TailBuffer(10).append('x' * 25) previously
+    """Codex R3 flagged: TailBuffer(10).append('x' * 25) previously
     returned ''. Now must preserve the last 10 bytes."""
-    from ncdev.ai_session import _TailBuffer
+    from ncdev.utils import TailBuffer
 
-    buf = _TailBuffer(10)
+    buf = TailBuffer(10)
     buf.append("x" * 25)
     text = buf.text()
     assert buf.truncated is True
@@ -377,9 +420,9 @@ def test_tail_buffer_preserves_tail_of_oversized_chunk():
 
 def test_tail_buffer_normal_eviction_across_chunks():
     """Multiple small chunks — head gets evicted as cap is exceeded."""
-    from ncdev.ai_session import _TailBuffer
+    from ncdev.utils import TailBuffer
 
-    buf = _TailBuffer(10)
+    buf = TailBuffer(10)
     buf.append("aaaa")
     buf.append("bbbb")
     buf.append("cccc")    # total 12 > 10; head "aaaa" gets evicted
@@ -393,14 +436,29 @@ def test_tail_buffer_normal_eviction_across_chunks():
 def test_tail_buffer_keeps_last_chunk_even_when_oversized_alone():
     """When only one chunk exists and it's oversized, slice its tail
     instead of losing everything."""
-    from ncdev.ai_session import _TailBuffer
+    from ncdev.utils import TailBuffer
 
-    buf = _TailBuffer(5)
+    buf = TailBuffer(5)
     buf.append("1234567890")
     text = buf.text()
     assert text == "67890"
 
 
+def test_tail_buffer_long_stream_keeps_exact_tail():
+    """Many appends past the cap — the buffer keeps the most recent
+    lines and its size bookkeeping never drifts above the cap."""
+    from ncdev.utils import TailBuffer
+
+    buf = TailBuffer(100)
+    for i in range(10_000):
+        buf.append(f"line {i:05d}\n")
+    text = buf.text()
+    assert buf.truncated is True
+    assert text.endswith("line 09999\n")
+    assert len(text.encode("utf-8")) <= 100
+    assert buf._size == len(text.encode("utf-8"))
+
+
 def test_run_codex_session_watchdog_kills_hung_child(tmp_path: Path):
     """Integration: actual hung child must be killed by the watchdog,
     same guarantee as run_claude_session."""
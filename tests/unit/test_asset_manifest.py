@@ -171,6 +171,23 @@ def test_scan_ignores_external_urls(tmp_path: Path):
     assert len(hits) == 0
 
 
+def test_scan_reports_line_numbers_and_skips_reference_free_files(tmp_path: Path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "util.ts").write_text("export const add = (a, b) => a + b;\n")
+    (src / "Card.tsx").write_text(
+        "const a = 1;\n\n"
+        "<img src=\"/a.png\" />\n"
+        "// nothing here\n"
+        ".x { background: url(b.svg) }\n"
+    )
+    hits = scan_code_for_asset_references(tmp_path)
+    assert sorted(hits) == [
+        ("src/Card.tsx", "/a.png", 3),
+        ("src/Card.tsx", "b.svg", 5),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Verification
 # ---------------------------------------------------------------------------
@@ -1,15 +1,27 @@
 import os
 import sys
+from types import SimpleNamespace
 
+import pytest
+
+from ncdev.core import availability
 from ncdev.core.availability import (
     cli_binary_available,
     env_var_set,
     make_default_checker,
     provider_available,
+    reset_cache,
 )
 from ncdev.core.config import NCDevConfig, ProviderPreferenceConfig
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    reset_cache()
+    yield
+    reset_cache()
+
+
 def test_cli_binary_available_finds_python() -> None:
     # Some Python binary must exist for the test runner itself.
     assert cli_binary_available(os.path.basename(sys.executable)) is True
@@ -19,6 +31,33 @@ def test_cli_binary_available_returns_false_for_garbage() -> None:
     assert cli_binary_available("definitely-not-a-real-binary-zzz999") is False
 
 
+def test_cli_binary_available_rechecks_when_path_changes(monkeypatch, tmp_path) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(availability, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    binary = tmp_path / "ncdev-fake-cli"
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert cli_binary_available("ncdev-fake-cli") is False
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+    # Same PATH inside the TTL: the cached miss stands.
+    clock[0] += availability._WHICH_TTL_SECONDS / 2
+    assert cli_binary_available("ncdev-fake-cli") is False
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}")
+    assert cli_binary_available("ncdev-fake-cli") is True
+
+
+def test_cli_binary_available_rechecks_after_ttl(monkeypatch, tmp_path) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(availability, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert cli_binary_available("ncdev-fake-cli") is False
+    binary = tmp_path / "ncdev-fake-cli"
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+    clock[0] += availability._WHICH_TTL_SECONDS
+    assert cli_binary_available("ncdev-fake-cli") is True
+
+
 def test_env_var_set_true(monkeypatch) -> None:
     monkeypatch.setenv("TEST_VAR_XYZ", "value")
     assert env_var_set("TEST_VAR_XYZ") is True
@@ -225,6 +225,25 @@ def test_generate_charter_returns_none_when_session_fails(tmp_path: Path):
     assert session.success is False
 
 
+def test_generate_charter_negative_retry_budget_runs_once(tmp_path: Path):
+    calls: list[str] = []
+
+    def fake_session(prompt, **kwargs):  # noqa: ARG001
+        calls.append(prompt)
+        return ClaudeSessionResult(success=False, final_text="", exit_code=1)
+
+    with patch("ncdev.pipeline.charter.run_ai_session", side_effect=fake_session):
+        result_bundle, session = generate_charter(
+            prd_path=tmp_path / "prd.md",
+            output_dir=tmp_path / "outputs",
+            max_retries=-1,
+        )
+
+    assert result_bundle is None
+    assert session.success is False
+    assert len(calls) == 1
+
+
 def test_generate_charter_returns_none_on_invalid_json(tmp_path: Path):
     def fake_session(prompt, **kwargs):  # noqa: ARG001
         out = kwargs["cwd"]
@@ -369,3 +388,17 @@ def test_charter_prompt_documents_acceptance_field() -> None:
     assert "required_files" in prompt
     assert "required_tests" in prompt
     assert "MANDATORY" in prompt
+
+
+def test_schema_excerpt_built_once_per_model(tmp_path: Path):
+    from ncdev.pipeline import charter as charter_mod
+
+    charter_mod._schema_excerpt.cache_clear()
+    with patch.object(
+        TargetProjectContract, "model_json_schema",
+        wraps=TargetProjectContract.model_json_schema,
+    ) as spy:
+        first = build_charter_prompt(tmp_path / "prd.md", None, tmp_path)
+        second = build_charter_prompt(tmp_path / "prd.md", None, tmp_path)
+    assert first == second
+    assert spy.call_count == 1
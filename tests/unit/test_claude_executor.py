@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import re
 import subprocess
 import time
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 
 from ncdev.claude_session import ClaudeSessionResult
 from ncdev.pipeline.asset_manifest import save_feature_manifest
 from ncdev.pipeline.claude_executor import (
+    _diff_since,
+    _git_head,
+    _git_head_and_dirty,
+    _grep_for_prohibited,
+    _post_session_verification,
     build_feature_prompt,
     execute_feature_claude_driven,
 )
@@ -331,6 +338,105 @@ def test_legacy_prohibited_pattern_outside_touched_files_does_not_block_pass(tmp
     assert result.status == StepStatus.PASSED
 
 
+def test_grep_for_prohibited_single_pass_names_the_hit(tmp_path: Path):
+    _init_git(tmp_path)
+    (tmp_path / "a.py").write_text("x = 1  # FIXME later\n")
+    (tmp_path / "b.ts").write_text("console.log(x)\n")
+    (tmp_path / "c.py").write_text("clean = True\n")
+    (tmp_path / "d.py").write_text("aa\n")
+    subprocess.run(["git", "add", "-A"], cwd=str(tmp_path), check=True)
+
+    # "console.log(" is not a valid regex, so it is matched literally.
+    patterns = ["TODO", "FIX+ME", "console.log("]
+    assert sorted(_grep_for_prohibited(tmp_path, patterns)) == [
+        "a.py contains 'FIX+ME'",
+        "b.ts contains 'console.log('",
+    ]
+    # All-literal contracts skip the regex engine; same answers.
+    assert sorted(_grep_for_prohibited(tmp_path, ["FIXME", "console.log("])) == [
+        "a.py contains 'FIXME'",
+        "b.ts contains 'console.log('",
+    ]
+    # Non-ASCII and CRLF files take the decoded path; same answers.
+    (tmp_path / "e.py").write_text("naïve = 1  # TODO\n")
+    (tmp_path / "f.py").write_bytes(b"x = 1\r\n# FIXME\r\n")
+    subprocess.run(["git", "add", "-A"], cwd=str(tmp_path), check=True)
+    assert _grep_for_prohibited(
+        tmp_path, patterns, touched_files=["e.py", "f.py"],
+    ) == ["e.py contains 'TODO'", "f.py contains 'FIX+ME'"]
+    # A pattern with its own groups can't be fused (its backreference
+    # would shift); the per-pattern scan still finds it.
+    assert _grep_for_prohibited(tmp_path, ["TODO", r"(a)\1"]) == [
+        "d.py contains '(a)\\1'",
+        "e.py contains 'TODO'",
+    ]
+
+
+def test_grep_for_prohibited_touched_files_match_unusual_names(tmp_path: Path):
+    _init_git(tmp_path)
+    (tmp_path / "gone.py").write_text("clean\n")
+    (tmp_path / "old name.py").write_text("# TODO: renamed below\n")
+    subprocess.run(["git", "add", "-A"], cwd=str(tmp_path), check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "base"], cwd=str(tmp_path), check=True)
+    base = _git_head(tmp_path)
+    (tmp_path / "café.py").write_text("# TODO\n")
+    (tmp_path / "[x].py").write_text("# TODO\n")
+    (tmp_path / "gone.py").unlink()
+    subprocess.run(["git", "mv", "old name.py", "new name.py"], cwd=str(tmp_path), check=True)
+    subprocess.run(["git", "add", "-A"], cwd=str(tmp_path), check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "feature"], cwd=str(tmp_path), check=True)
+    (tmp_path / "other.py").write_text("# TODO\n")   # untouched by the feature
+
+    # The touched paths come from the feature's own diff, as in the
+    # executor: non-ASCII, spaced and glob-like names must come back
+    # verbatim rather than quoted or expanded.
+    created, modified = _diff_since(tmp_path, base)
+    assert sorted(created) == ["[x].py", "café.py"]
+    assert modified == ["new name.py"]
+    assert sorted(_grep_for_prohibited(
+        tmp_path, ["TODO"], touched_files=created + modified,
+    )) == [
+        "[x].py contains 'TODO'",
+        "café.py contains 'TODO'",
+        "new name.py contains 'TODO'",
+    ]
+
+
+def test_as_re2_agrees_with_re():
+    pytest.importorskip("re2")
+    from ncdev.pipeline import claude_executor
+
+    patterns = [
+        r"TODO|FIX+ME",
+        r"\bprint\(",
+        r"pass$",
+        r"[[:alpha:]]+",
+        r"foo(?=bar)",
+        r"\w+\s*=\s*\d",
+    ]
+    samples = [
+        b"x = 1\n",
+        b"# TODO later\n",
+        b"FIXXME\n",
+        b"print(x)\n",
+        b"if x:\n    pass\n",
+        b"a:b [\n",
+        b"foobar aa\n",
+    ]
+    for pattern in patterns:
+        fused = claude_executor._fuse_prohibited([(pattern, re.compile(pattern))])
+        plain = claude_executor._as_bytes_pattern(fused)
+        matcher = claude_executor._as_re2(plain)
+        for data in samples:
+            want = plain.search(data)
+            got = matcher.search(data)
+            # re2 names groups in bytes; the scan only needs the index.
+            assert (got and (got.span(), int(got.lastgroup[2:]))) == (
+                want and (want.span(), int(want.lastgroup[2:]))
+            ), (pattern, data)
+    assert claude_executor._as_re2(None) is None
+
+
 def test_verification_runs_backend_test_command_when_configured(tmp_path: Path):
     """New enforcement: backend_test_command actually runs, not just documented."""
     target = tmp_path / "app"
@@ -364,6 +470,80 @@ def test_verification_runs_backend_test_command_when_configured(tmp_path: Path):
     assert any("backend tests failed" in r for r in reasons)
 
 
+def test_git_head_and_dirty_matches_rev_parse_and_status(tmp_path: Path):
+    assert _git_head_and_dirty(tmp_path) == ("", False)   # not a repo
+    _init_git(tmp_path)
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=str(tmp_path),
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    assert _git_head_and_dirty(tmp_path) == (head, False)
+    (tmp_path / "new.py").write_text("x = 1\n")
+    assert _git_head_and_dirty(tmp_path) == (head, True)
+
+
+def test_git_head_and_dirty_keeps_head_when_status_times_out(tmp_path: Path, monkeypatch):
+    _init_git(tmp_path)
+    head = _git_head(tmp_path)
+    real_run = subprocess.run
+
+    def slow_status(cmd, *args, **kwargs):
+        if cmd[:2] == ["git", "status"]:
+            raise subprocess.TimeoutExpired(cmd, kwargs.get("timeout"))
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr("ncdev.pipeline.claude_executor.subprocess.run", slow_status)
+    assert _git_head_and_dirty(tmp_path) == (head, False)
+
+
+def test_backend_and_frontend_suites_run_concurrently(tmp_path: Path):
+    # Each suite only passes if it sees the other's marker while it is
+    # still running, which can't happen if they run back to back.
+    wait_for = (
+        "touch {mine}; for i in $(seq 100); do "
+        "[ -f {other} ] && exit 0; sleep 0.05; done; exit 1"
+    )
+    bundle = _make_bundle()
+    bundle.verification.prohibited_patterns = []
+    bundle.verification.assets_manifest_required = False
+    bundle.verification.backend_test_command = wait_for.format(mine="be", other="fe")
+    bundle.verification.frontend_test_command = wait_for.format(mine="fe", other="be")
+
+    ver = _post_session_verification(
+        tmp_path, _make_feature(), bundle, probe_health=False,
+    )
+
+    assert ver.integration_tests.success and ver.e2e_tests.success
+    assert ver.overall_passed
+
+
+def test_verification_skips_test_commands_when_no_commit(tmp_path: Path):
+    """No commit means FAILED regardless — the suites must not run."""
+    target = tmp_path / "app"
+    target.mkdir()
+    _init_git(target)
+
+    def fake_session(prompt, **kwargs):  # noqa: ARG001
+        return ClaudeSessionResult(success=False, final_text="", exit_code=1)
+
+    bundle = _make_bundle()
+    bundle.verification.backend_test_command = f"touch {tmp_path / 'ran.flag'}"
+
+    with patch("ncdev.pipeline.claude_executor.run_ai_session", side_effect=fake_session):
+        result = execute_feature_claude_driven(
+            feature=_make_feature(),
+            target_path=target,
+            run_dir=tmp_path / "run",
+            charter_bundle=bundle,
+            prior_results=[],
+            project_id="myapp",
+        )
+
+    assert result.status == StepStatus.FAILED
+    assert not (tmp_path / "ran.flag").exists()
+    assert any("made no commit" in r for r in result.verification.failure_reasons)
+
+
 def test_health_probe_polls_until_app_comes_up(monkeypatch):
     """Codex R3 blocker: probe was single-shot; now it must poll and
     accept the app when it comes up within boot_timeout_seconds."""
@@ -913,3 +1093,13 @@ def test_file_mentions_token_helper_handles_path_match(tmp_path: Path):
 def test_file_mentions_token_helper_returns_false_on_oserror(tmp_path: Path):
     from ncdev.pipeline.claude_executor import _file_mentions_token
     assert _file_mentions_token(tmp_path / "missing.py", "anything") is False
+
+
+def test_last_line_helper_returns_final_non_blank_line():
+    from ncdev.pipeline.claude_executor import _last_line
+
+    out = "collected 3 items\n\n" + ("." * 80 + "\n") * 5000 + "  3 passed in 0.1s  \n\n\n"
+    assert _last_line(out) == "  3 passed in 0.1s"
+    assert _last_line("\r\nFAILED x\r\n") == "FAILED x"
+    assert _last_line("   only line   ") == "only line"
+    assert _last_line(" \n\t\n") == "(no output)"
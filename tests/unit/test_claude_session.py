@@ -11,6 +11,7 @@ subprocess layer. They verify:
 from __future__ import annotations
 
 import json
+import os
 import time
 from pathlib import Path
 from unittest.mock import patch
@@ -267,6 +268,17 @@ def test_final_text_from_result_event(tmp_path: Path):
     assert result.final_text == "build complete"
 
 
+def test_result_event_json_only_stdlib_accepts_is_kept(tmp_path: Path):
+    # json.dumps escapes the lone surrogate as "\ud800" and writes NaN
+    # bare; orjson rejects both, so the parser must fall back, not drop.
+    events = [{"type": "result", "result": "done \ud800", "total_cost_usd": float("nan")}]
+    popen, _ = _popen_factory(events)
+    with patch("ncdev.claude_session.shutil.which", return_value="/usr/bin/claude"):
+        with patch("ncdev.claude_session.subprocess.Popen", side_effect=popen):
+            result = run_claude_session("x", cwd=tmp_path, include_codex_protocol=False)
+    assert result.final_text == "done \ud800"
+
+
 def test_final_text_falls_back_to_last_assistant_message(tmp_path: Path):
     # No result event — runner falls back to extracting from last assistant event
     events = [
@@ -335,6 +347,8 @@ def test_event_log_written_as_jsonl(tmp_path: Path):
     assert len(lines) == 2
     assert json.loads(lines[0])["type"] == "assistant"
     assert json.loads(lines[1])["type"] == "result"
+    # Lines are logged verbatim, not re-serialised
+    assert lines[1] == json.dumps(events[1])
 
 
 def test_malformed_json_line_is_tolerated(tmp_path: Path):
@@ -447,6 +461,30 @@ def test_events_not_retained_by_default(tmp_path: Path):
     assert result.final_text == "ok"
 
 
+def test_tool_call_raw_items_follow_retain_events(tmp_path: Path):
+    """Write tool_use items carry whole file bodies — don't hold them
+    for the session's lifetime unless events are retained too."""
+    events = [
+        {"type": "assistant", "message": {"content": [
+            {"type": "tool_use", "name": "Write",
+             "input": {"file_path": "/a.py", "content": "x" * 10_000}},
+        ]}},
+        {"type": "result", "result": "ok"},
+    ]
+    for retain in (False, True):
+        popen, _ = _popen_factory(events)
+        with patch("ncdev.claude_session.shutil.which", return_value="/usr/bin/claude"):
+            with patch("ncdev.claude_session.subprocess.Popen", side_effect=popen):
+                result = run_claude_session(
+                    "x", cwd=tmp_path, include_codex_protocol=False,
+                    retain_events=retain,
+                )
+        call = result.tool_calls[0]
+        assert call.input_summary == "/a.py"
+        assert result.files_touched == ["/a.py"]
+        assert bool(call.raw) is retain
+
+
 def test_retain_events_flag_opt_in(tmp_path: Path):
     events = [
         {"type": "assistant", "message": {"content": []}},
@@ -576,3 +614,58 @@ def test_summary_includes_key_signals(tmp_path: Path):
     assert "cost=$1.230" in s
     assert "skills=verification-before-completion" in s
     assert "codex=1" in s
+
+
+def test_read_text_cached_until_file_changes(tmp_path: Path):
+    import os
+
+    from ncdev.utils import read_text_cached
+
+    proto = tmp_path / "proto.md"
+    proto.write_text("v1", encoding="utf-8")
+    assert read_text_cached(proto) == "v1"
+    with patch("pathlib.Path.read_text", side_effect=AssertionError("re-read")):
+        assert read_text_cached(proto) == "v1"
+    proto.write_text("v2-edited", encoding="utf-8")
+    st = proto.stat()
+    os.utime(proto, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert read_text_cached(proto) == "v2-edited"
+
+
+def test_stderr_capture_is_tail_bounded(tmp_path: Path):
+    from ncdev import claude_session
+
+    events = [{"type": "result", "result": "ok"}]
+    popen, _ = _popen_factory(events, stderr="HEAD" + "x" * 5000 + "TAIL")
+    with patch.object(claude_session, "_STDERR_CAPTURE_MAX_BYTES", 1000):
+        with patch("ncdev.claude_session.shutil.which", return_value="/usr/bin/claude"):
+            with patch("ncdev.claude_session.subprocess.Popen", side_effect=popen):
+                result = run_claude_session(
+                    "x", cwd=tmp_path, include_codex_protocol=False,
+                )
+    assert len(result.stderr) <= 1000
+    assert result.stderr.endswith("TAIL")
+    assert "HEAD" not in result.stderr
+
+
+def test_env_inherited_unless_hooks_inject_variables(tmp_path: Path):
+    popen, captured = _popen_factory([{"type": "result", "result": "ok"}])
+    with patch("ncdev.claude_session.shutil.which", return_value="/usr/bin/claude"):
+        with patch("ncdev.claude_session.subprocess.Popen", side_effect=popen):
+            run_claude_session(
+                "x", cwd=tmp_path, include_codex_protocol=False,
+                enable_ncdev_hooks=False,
+            )
+    assert captured["kwargs"]["env"] is None
+
+    settings = tmp_path / "settings.json"
+    settings.write_text("{}", encoding="utf-8")
+    with patch("ncdev.claude_session.shutil.which", return_value="/usr/bin/claude"):
+        with patch("ncdev.claude_session.subprocess.Popen", side_effect=popen):
+            run_claude_session(
+                "x", cwd=tmp_path, include_codex_protocol=False,
+                settings_path=settings,
+            )
+    env = captured["kwargs"]["env"]
+    assert "NCDEV_HOOKS_DIR" in env
+    assert env.get("PATH") == os.environ.get("PATH")
@@ -39,6 +39,26 @@ def test_parse_steward_response_strips_markdown_fences():
     assert decision.disposition == Disposition.CONTINUE
 
 
+def test_parse_steward_response_takes_last_object_amid_prose():
+    draft = json.dumps({"disposition": "continue", "reasoning": "draft"})
+    final = json.dumps({
+        "disposition": "continue",
+        "reasoning": "final {braces} in prose",
+        "capability_lessons": ["x"],
+    })
+    payload = f"Draft: {draft}\nOn reflection, {{not json}} — final:\n{final}\nDone."
+    decision = parse_steward_response(payload)
+    assert decision.reasoning == "final {braces} in prose"
+    assert decision.capability_lessons == ["x"]
+
+
+def test_parse_steward_response_without_object_raises():
+    import pytest
+
+    with pytest.raises(ValueError):
+        parse_steward_response("I could not decide.")
+
+
 def test_parse_steward_response_invalid_disposition_raises():
     import pytest
 
@@ -31,6 +31,13 @@ def test_append_and_load_roundtrip(tmp_path: Path) -> None:
     assert "backend/app/auth.py" in loaded[0].files_created
 
 
+def test_append_creates_missing_run_dir(tmp_path: Path) -> None:
+    run_dir = tmp_path / "runs" / "r1"
+    for sha in ("aaa", "bbb"):
+        append_provenance(run_dir, ProvenanceRecord(feature_id="f01", commit_sha=sha))
+    assert [r.commit_sha for r in load_provenance(run_dir)] == ["aaa", "bbb"]
+
+
 def test_files_for_feature_returns_union(tmp_path: Path) -> None:
     append_provenance(tmp_path, ProvenanceRecord(
         feature_id="f02-auth",
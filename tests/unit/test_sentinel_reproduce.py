@@ -120,3 +120,11 @@ def test_reproduced_false_when_session_fails(monkeypatch, tmp_path):
     monkeypatch.setattr(sr, "run_ai_session", fake_session)
     result = reproduce_failure(_report(), repo)
     assert result.reproduced is False
+
+
+def test_unrelated_test_error_markers_match_case_insensitively():
+    from ncdev.sentinel_reproduce import _looks_like_unrelated_test_error
+
+    assert _looks_like_unrelated_test_error("E   ModuleNotFoundError: No module named 'x'")
+    assert _looks_like_unrelated_test_error("...\ncollected 0 items\n")
+    assert not _looks_like_unrelated_test_error("AssertionError: expected 3, got 2")
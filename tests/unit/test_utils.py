@@ -0,0 +1,56 @@
+"""Tests for the shared helpers in ncdev.utils."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from ncdev.utils import read_git_head, run_shell
+
+
+def test_run_shell_keeps_only_output_tail(tmp_path):
+    ok, out = run_shell(
+        f"\"{sys.executable}\" -c \"print('x' * 50000); print('3 passed')\"",
+        cwd=tmp_path, timeout=30, max_bytes=1000,
+    )
+    assert ok
+    assert len(out) < 2100
+    assert out.rstrip().endswith("3 passed")
+
+
+def test_run_shell_timeout_reports_failure(tmp_path):
+    ok, out = run_shell("sleep 30", cwd=tmp_path, timeout=1)
+    assert not ok
+    assert out.startswith("timed out after 1s")
+
+
+def test_run_shell_survives_invalid_utf8(tmp_path):
+    ok, out = run_shell(
+        f"printf '\\377'; \"{sys.executable}\" -c \"print('x' * 300000); print('1 passed')\"",
+        cwd=tmp_path, timeout=10,
+    )
+    assert ok
+    assert out.startswith("\ufffd")
+    assert out.rstrip().endswith("1 passed")
+
+
+def test_read_git_head_matches_rev_parse(tmp_path):
+    def rev_parse() -> str:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=tmp_path,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    assert read_git_head(tmp_path) is None   # unborn branch: defer to git
+    subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t",
+         "commit", "-q", "--allow-empty", "-m", "init"],
+        cwd=tmp_path, check=True,
+    )
+    assert read_git_head(tmp_path) == rev_parse()          # loose ref
+    subprocess.run(["git", "pack-refs", "--all"], cwd=tmp_path, check=True)
+    assert read_git_head(tmp_path) == rev_parse()          # packed ref
+    subprocess.run(["git", "checkout", "-q", "--detach"], cwd=tmp_path, check=True)
+    assert read_git_head(tmp_path) == rev_parse()          # detached
+    assert read_git_head(tmp_path / "missing") is None